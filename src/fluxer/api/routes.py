@@ -12,7 +12,7 @@ from ..extractors.firecrawl_extractor import FirecrawlProductExtractor
 from ..search.serp_processor import SerpProcessor
 from ..seo.seo_analyzer import SEOAnalyzer, SEOAnalysisResult
 from ..seo.description_generator import DescriptionGenerator
-from ..seo.entity_extractor import EntityExtractor
+from ..seo.entity_extractor import get_entity_extractor
 from ..config import Config
 from ..logger import get_logger
 
@@ -1166,8 +1166,8 @@ def extract_entities() -> tuple[Dict[str, Any], int]:
 
         logger.info(f"Extracting entities for product: {product_name} ({len(tfidf_terms)} TF-IDF terms, force_llm={force_llm})")
 
-        # Initialize entity extractor
-        entity_extractor = EntityExtractor()
+        # Shared extractor; sub-engine construction is amortized per worker
+        entity_extractor = get_entity_extractor()
 
         # Extract entities using hybrid approach
         # Pass search_query for better LLM context (helps understand product type)
@@ -1248,8 +1248,8 @@ def extract_entities_batch() -> tuple[Dict[str, Any], int]:
 
         logger.info(f"Extracting entities for {len(products)} products")
 
-        # Initialize entity extractor
-        entity_extractor = EntityExtractor()
+        # Shared extractor; sub-engine construction is amortized per worker
+        entity_extractor = get_entity_extractor()
 
         results = []
         for product in products:
@@ -42,6 +42,8 @@ class Config:
     ENTITY_CONFIDENCE_THRESHOLD: float = float(os.getenv("ENTITY_CONFIDENCE_THRESHOLD", "0.7"))
     # Enable/disable LLM extraction entirely
     ENTITY_LLM_ENABLED: bool = os.getenv("ENTITY_LLM_ENABLED", "true").lower() == "true"
+    # Parallel votes per term-grouping call (1 = single call, no voting)
+    GROUPING_VOTE_K: int = int(os.getenv("GROUPING_VOTE_K", "1"))
 
     # Flask settings
     FLASK_ENV: str = os.getenv("FLASK_ENV", "development")
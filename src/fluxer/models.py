@@ -4,7 +4,7 @@ Data models for Fluxer product extraction.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 
 
 @dataclass(slots=True)
@@ -194,7 +194,9 @@ class PlacementRecommendation:
     """Recommendation for where to place an entity on a product page."""
     entity_name: str
     entity_type: str
-    recommended_sections: List[str]  # e.g., ['specs_table', 'care_instructions']
+    # e.g., ('specs_table', 'care_instructions'); tuples from the shared
+    # placement rules are passed through without copying
+    recommended_sections: Sequence[str]
     reasoning: str
 
     def to_dict(self) -> dict:
@@ -1,18 +1,35 @@
 """Utilities for fetching immersive product results from the SERP API."""
 from __future__ import annotations
 
+import hashlib
+import itertools
 import logging
 import os
-import random
 import re
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
 from dotenv import load_dotenv
-from serpapi import GoogleSearch
 
 logger = logging.getLogger(__name__)
 
+_SERP_ENDPOINT = "https://serpapi.com/search.json"
+
+# Shared session so all SerpApi calls reuse one TCP+TLS connection instead
+# of paying a fresh handshake per query.
+_SESSION = requests.Session()
+
+
+def _serp_get(params: Dict[str, str]) -> dict:
+    """Execute a SerpApi search over the shared HTTP session."""
+    response = _SESSION.get(_SERP_ENDPOINT, params=params, timeout=30)
+    response.raise_for_status()
+    return response.json()
+
 
 @dataclass(slots=True)
 class ProductHit:
@@ -69,8 +86,7 @@ class SerpProcessor:
                 "gl": "au",
                 "hl": "en"
             }
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = _serp_get(params)
 
             products: List[dict] = results.get("immersive_products") or []
             source_type = "immersive_products"
@@ -94,10 +110,14 @@ class SerpProcessor:
                 logger.info(f"Google Shopping API returned {len(products)} products")
 
             per_query: Dict[str, ProductHit] = {}
-            for item in products[:limit]:
+            for item in islice(products, limit):
                 title = item.get("title")
                 if not title:
                     continue
+                # Intern titles: they are reused as dict keys and compared again
+                # during enrichment, so sharing one string object keeps hashing
+                # and equality checks cheap.
+                title = sys.intern(title)
                 per_query[title] = ProductHit(
                     title=title,
                     price=item.get("price"),
@@ -146,15 +166,14 @@ class SerpProcessor:
                 "api_key": api_key,
             }
 
-            search = GoogleSearch(params)
-            results = search.get_dict()
+            results = _serp_get(params)
 
             shopping_results = results.get("shopping_results") or []
             logger.info(f"Google Shopping API returned {len(shopping_results)} results for '{query}'")
 
             # Map google_shopping response fields to our expected format
             products = []
-            for item in shopping_results[:limit]:
+            for item in islice(shopping_results, limit):
                 products.append({
                     "title": item.get("title"),
                     "price": item.get("price"),
@@ -207,9 +226,9 @@ class SerpProcessor:
         tasks: List[Tuple[ProductHit, str, str, dict, Tuple[str, str]]] = []
 
         for query_key, hits_by_title in aggregated.by_query.items():
-            items = list(hits_by_title.items())
+            items = hits_by_title.items()
             if max_per_query is not None:
-                items = items[:max_per_query]
+                items = islice(items, max_per_query)
 
             for title, hit in items:
                 # Skip if already has link (from shopping_results)
@@ -246,8 +265,7 @@ class SerpProcessor:
         def fetch_link(params: dict) -> Optional[str]:
             """Fetch single organic link."""
             try:
-                search = GoogleSearch(params)
-                results = search.get_dict()
+                results = _serp_get(params)
                 organic = results.get("organic_results") or []
                 if organic:
                     return organic[0].get("link")
@@ -290,9 +308,19 @@ class SerpProcessor:
 __all__ = ["SerpProcessor", "ProductHit", "AggregatedResults"]
 
 
+_WS_RE = re.compile(r"\s+")
+
+# Disambiguates duplicate slugs: hashing (query, counter) gives each key a
+# deterministic, collision-free suffix, so repeated runs over the same query
+# sequence produce reproducible by_query keys.
+_COUNTER = itertools.count()
+
+
 def _make_query_key(query: str, digits: int = 5) -> str:
-    slug = re.sub(r"\s+", "_", query.strip().lower())
-    suffix = random.randint(10 ** (digits - 1), (10 ** digits) - 1)
+    slug = _WS_RE.sub("_", query.strip().lower())
+    suffix = hashlib.blake2b(
+        f"{query}\0{next(_COUNTER)}".encode(), digest_size=digits
+    ).hexdigest()[:digits]
     return f"{slug}_{suffix}"
 
 
@@ -12,7 +12,7 @@ from .spacy_extractor import SpacyExtractor
 from .keyword_merger import KeywordMerger
 from .seo_analyzer import SEOAnalyzer
 from .description_generator import DescriptionGenerator, GeneratedDescription
-from .entity_extractor import EntityExtractor
+from .entity_extractor import EntityExtractor, get_entity_extractor
 
 __all__ = [
     'TextCleaner',
@@ -23,4 +23,5 @@ __all__ = [
     'DescriptionGenerator',
     'GeneratedDescription',
     'EntityExtractor',
+    'get_entity_extractor',
 ]
@@ -8,8 +8,14 @@ TF-IDF term grouping is now fully LLM-powered for dynamic, context-aware categor
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
-from typing import List, Dict, Tuple, Optional, Any
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, FrozenSet, Tuple, Optional, Any
 
 from ..models import (
     EntityExtractionResult,
@@ -29,25 +35,292 @@ logger = get_logger(__name__)
 
 # Check OpenAI availability for dynamic term grouping
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     logger.info("OpenAI not available for dynamic term grouping")
 
-# Global OpenAI client (lazy initialization)
-_openai_client: Optional[Any] = None
+# orjson parses and serializes the grouping payloads several times faster
+# than stdlib json; fall back transparently when it is not installed.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# except clauses cover both.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Connection-pool sizing for the shared async client: enough keepalive
+# connections to cover the batch fan-out without renegotiating TLS per call.
+_POOL_LIMITS = {"max_connections": 64, "max_keepalive_connections": 32}
 
 
+@lru_cache(maxsize=1)
 def _get_openai_client() -> Optional[Any]:
-    """Get or initialize the OpenAI client."""
-    global _openai_client
-    if _openai_client is None and OPENAI_AVAILABLE:
-        api_key = Config.OPENAI_API_KEY
-        if api_key:
-            _openai_client = OpenAI(api_key=api_key)
-            logger.debug("OpenAI client initialized for term grouping")
-    return _openai_client
+    """Get or initialize the shared OpenAI client.
+
+    lru_cache makes the lazy singleton thread-safe without a manual global;
+    tests can reset it via _get_openai_client.cache_clear().
+    """
+    if not OPENAI_AVAILABLE or not Config.OPENAI_API_KEY:
+        return None
+    logger.debug("OpenAI client initialized for term grouping")
+    return OpenAI(api_key=Config.OPENAI_API_KEY)
+
+
+# Category-level recommendations are fixed data, so build them once at
+# import instead of re-allocating identical objects on every placement-map
+# call. Sections are tuples, so sharing by reference is safe.
+_CAT_SPECS = PlacementRecommendation(
+    entity_name='Specifications',
+    entity_type='core_attributes',
+    recommended_sections=('specs_table',),
+    reasoning='Core attribute terms should populate the specifications table.'
+)
+
+_CAT_FEATURES = PlacementRecommendation(
+    entity_name='Features & Benefits',
+    entity_type='functional_terms',
+    recommended_sections=('features', 'hero_copy'),
+    reasoning='Functional advantages highlight key benefits.'
+)
+
+_CAT_USAGE = PlacementRecommendation(
+    entity_name='Designed For',
+    entity_type='usage_context',
+    recommended_sections=('designed_for', 'use_cases'),
+    reasoning='Usage context helps customers assess suitability.'
+)
+
+_CAT_SPECS_SIMPLE = PlacementRecommendation(
+    entity_name='Specifications',
+    entity_type='core_attributes',
+    recommended_sections=('specs_table',),
+    reasoning='Core attributes populate specifications.'
+)
+
+_CAT_FEATURES_SIMPLE = PlacementRecommendation(
+    entity_name='Features & Benefits',
+    entity_type='functional_terms',
+    recommended_sections=('features', 'hero_copy'),
+    reasoning='Functional terms highlight benefits.'
+)
+
+
+# Terms per clean+group LLM request; longer lists are chunked and fanned out
+# rather than silently truncated.
+_GROUPING_CHUNK_SIZE = 150
+
+# Chunks at or above this size stream the completion rather than buffering
+# the whole response object; small payloads keep the simpler path.
+_GROUPING_STREAM_THRESHOLD = 75
+
+# Constant instructions for the clean+group call. Kept in a system message so
+# the per-call user message carries only the variable context and term list,
+# letting provider-side prompt caching reuse the instruction prefix.
+_GROUP_SYSTEM_PROMPT = """You are a product data analyst. Filter and categorize TF-IDF terms extracted from product listings.
+
+STEP 1 - FILTER: Remove all terms that are NOT product attributes:
+- Shipping/delivery (free delivery, standard shipping, express, dispatch, orders)
+- Store/website names (any brand or retailer names)
+- Pricing (price, sale, discount, offer, cheap, affordable)
+- Generic marketing (best, top, new, popular, trending, must-have)
+- Return/exchange policies (returned, exchanged, refund)
+- Location/availability (australia, online, in stock, available)
+- Sizing systems alone (au, us, uk) unless with actual size
+- Random noise or incomplete phrases
+Be aggressive - when in doubt, remove it.
+
+STEP 2 - CATEGORIZE: Put each remaining term into ONE of these groups:
+1. "Core Attributes" - Physical properties: size, dimensions, materials, colors, patterns, design features, fabric types, fits, styles
+2. "Functional Terms" - Performance & benefits: durability, resistance, breathability, stretch, comfort, technical features
+3. "Care Instructions" - Maintenance: washing, cleaning, ironing, drying instructions
+4. "Compliance / Standards" - Certifications, safety standards, warranties (NOT shipping/delivery)
+
+All filtered-out terms go in "Noise".
+
+IMPORTANT RULES:
+- Color names and patterns (e.g., "marle", "leo water", "stripe") go in "Core Attributes"
+- Shipping/delivery terms go in "Noise" (e.g., "free delivery", "standard delivery")
+- Care-related terms go in "Care Instructions" (e.g., "machine wash", "cold wash")
+- Only actual certifications/standards go in "Compliance / Standards" (e.g., "ISO", "OEKO-TEX")
+
+Return ONLY valid JSON in this exact format:
+{"Core Attributes": ["term1", "term2"], "Functional Terms": ["term3"], "Care Instructions": ["term4"], "Compliance / Standards": ["term5"], "Noise": ["term6", "term7"]}
+
+Include ALL terms from the input. Empty categories should be empty arrays []."""
+
+
+def _phrases_from_tfidf(tfidf_terms: List[Any]) -> List[str]:
+    """Hoist non-empty phrases out of TF-IDF term data.
+
+    Accepts either a plain list of phrase strings (no per-item dict access)
+    or the usual list of term dicts with a 'phrase' key.
+    """
+    if not tfidf_terms:
+        return []
+    if isinstance(tfidf_terms[0], str):
+        return [p for p in (phrase.strip() for phrase in tfidf_terms) if p]
+    return [
+        p for p in (term_data.get('phrase', '').strip() for term_data in tfidf_terms)
+        if p
+    ]
+
+
+def _merge_grouping_results(
+    results: List[Tuple[Dict[str, List[str]], List[str]]]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Union per-chunk (grouped, noise) results, deduplicating per category.
+
+    Accumulates into dict-of-None buckets, which dedupe inline while
+    preserving insertion order — one structure per category instead of a
+    list plus a parallel seen-set.
+    """
+    merged: Dict[str, Dict[str, None]] = {}
+    noise: Dict[str, None] = {}
+
+    for grouped, chunk_noise in results:
+        for category, terms in grouped.items():
+            bucket = merged.setdefault(category, {})
+            for term in terms:
+                bucket[term] = None
+        for term in chunk_noise:
+            noise[term] = None
+
+    return {category: list(bucket) for category, bucket in merged.items() if bucket}, list(noise)
+
+
+# Keyword tokens for the no-LLM fallback grouping, mirroring the category
+# definitions in _GROUP_SYSTEM_PROMPT. Token frozensets respect word
+# boundaries — 'iso' cannot match inside 'poison' — and classification is a
+# C-level hash intersection per category rather than substring scans.
+_FALLBACK_CATEGORY_TOKENS = {
+    'Care Instructions': frozenset({
+        'wash', 'washable', 'clean', 'cleaning', 'iron', 'ironing', 'dry',
+        'drying', 'rinse', 'detergent', 'bleach', 'tumble',
+    }),
+    'Compliance / Standards': frozenset({
+        'iso', 'oeko-tex', 'astm', 'certified', 'certification', 'compliant',
+        'compliance', 'standard', 'standards', 'warranty', 'guarantee',
+    }),
+    'Functional Terms': frozenset({
+        'durable', 'durability', 'resistant', 'resistance', 'breathable',
+        'breathability', 'stretch', 'stretchy', 'comfort', 'comfortable',
+        'waterproof', 'lightweight', 'moisture', 'insulated', 'insulating',
+        'support', 'supportive', 'non-slip',
+    }),
+}
+
+
+def _build_fallback_classifier():
+    """Generate a straight-line classifier specialized to the category table.
+
+    The categories are fixed at import time, so instead of looping over
+    _FALLBACK_CATEGORY_TOKENS per phrase we emit one function whose body is
+    an unrolled if-chain of set intersections — no dict iteration and no
+    loop bookkeeping at call time.
+    """
+    namespace = {}
+    lines = ['def _classify(tokens):']
+    for index, (category, keywords) in enumerate(_FALLBACK_CATEGORY_TOKENS.items()):
+        namespace[f'_kw{index}'] = keywords
+        lines.append(f'    if tokens & _kw{index}: return {category!r}')
+    lines.append("    return 'Core Attributes'")
+    exec('\n'.join(lines), namespace)
+    return namespace['_classify']
+
+
+_fallback_classify = _build_fallback_classifier()
+
+
+def _fallback_group_terms(
+    phrases: List[str]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Keyword-token grouping used when the LLM is unavailable.
+
+    Each phrase's token set goes through the specialized classifier;
+    unmatched phrases default to Core Attributes. No noise filtering —
+    without the LLM we keep every term rather than guess.
+    """
+    grouped: Dict[str, List[str]] = {}
+    for phrase in phrases:
+        category = _fallback_classify(frozenset(phrase.lower().split()))
+        grouped.setdefault(category, []).append(phrase)
+    return grouped, []
+
+
+def _majority_vote_grouping(
+    results: List[Tuple[Dict[str, List[str]], List[str]]]
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Merge K vote results, keeping categories agreed by >= ceil(K/2) votes.
+
+    Terms without a quorum — or whose winning vote is "Noise" — land in the
+    noise list.
+    """
+    quorum = len(results) // 2 + 1
+    votes: Dict[str, Counter] = {}
+
+    for grouped, chunk_noise in results:
+        for category, terms in grouped.items():
+            for term in terms:
+                votes.setdefault(term, Counter())[category] += 1
+        for term in chunk_noise:
+            votes.setdefault(term, Counter())["Noise"] += 1
+
+    merged: Dict[str, List[str]] = {}
+    noise: List[str] = []
+    for term, counter in votes.items():
+        category, count = counter.most_common(1)[0]
+        if count < quorum or category == "Noise":
+            noise.append(term)
+        else:
+            merged.setdefault(category, []).append(term)
+
+    return merged, noise
+
+
+# Content-hash cache for clean+group responses. The grouping call runs at
+# temperature 0 and is re-issued for every product, so identical
+# (search_query, phrases, model) inputs — common on re-runs and
+# near-duplicate products — are served without another API call.
+_GROUPING_CACHE: Dict[str, Tuple[Dict[str, List[str]], List[str]]] = {}
+
+
+def _grouping_cache_key(
+    phrases: List[str],
+    search_query: Optional[str],
+    model: str
+) -> str:
+    """Build the cache key for a clean+group request."""
+    payload = _json_dumps([search_query or "", sorted(phrases), model])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _get_async_openai_client() -> Optional[Any]:
+    """Get or initialize the shared async OpenAI client.
+
+    The bounded httpx pool keeps TLS/HTTP2 connections alive across batched
+    calls instead of paying a fresh handshake per request. Tests can reset
+    via _get_async_openai_client.cache_clear().
+    """
+    if not OPENAI_AVAILABLE or not Config.OPENAI_API_KEY:
+        return None
+    logger.debug("Async OpenAI client initialized for term grouping")
+    return AsyncOpenAI(
+        api_key=Config.OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(**_POOL_LIMITS),
+            timeout=30.0,
+        ),
+    )
 
 
 class EntityExtractor:
@@ -65,62 +338,107 @@ class EntityExtractor:
     # Confidence threshold below which LLM is triggered
     CONFIDENCE_THRESHOLD = 0.7
 
-    # Entity types that should trigger LLM if missing
-    CRITICAL_TYPES = ['material', 'dimension']
+    # Entity types that should trigger LLM if missing; frozenset for O(1)
+    # membership checks in should_invoke
+    CRITICAL_TYPES: FrozenSet[str] = frozenset({'material', 'dimension'})
 
-    # Placement rules by entity type
+    # Placement rules by entity type; section tuples are immutable so the
+    # shared class-level data can never be grown by per-call appends
     PLACEMENT_RULES = {
         'material': {
-            'sections': ['specs_table', 'features', 'care_instructions'],
+            'sections': ('specs_table', 'features', 'care_instructions'),
             'reasoning': 'Material information belongs in specifications and care guidance.'
         },
         'dimension': {
-            'sections': ['specs_table', 'hero_copy'],
+            'sections': ('specs_table', 'hero_copy'),
             'reasoning': 'Dimensions are key specifications that help with fit assessment.'
         },
         'weight': {
-            'sections': ['specs_table', 'shipping_info'],
+            'sections': ('specs_table', 'shipping_info'),
             'reasoning': 'Weight affects shipping and handling considerations.'
         },
         'capacity': {
-            'sections': ['specs_table', 'features'],
+            'sections': ('specs_table', 'features'),
             'reasoning': 'Capacity is a key functional specification.'
         },
         'finish': {
-            'sections': ['specs_table', 'care_instructions'],
+            'sections': ('specs_table', 'care_instructions'),
             'reasoning': 'Finish affects appearance and maintenance requirements.'
         },
         'standard': {
-            'sections': ['specs_table', 'certifications', 'faq'],
+            'sections': ('specs_table', 'certifications', 'faq'),
             'reasoning': 'Standards/certifications should be clearly listed.'
         },
         'certification': {
-            'sections': ['specs_table', 'certifications', 'sustainability'],
+            'sections': ('specs_table', 'certifications', 'sustainability'),
             'reasoning': 'Certifications provide credibility and compliance info.'
         },
         'environment': {
-            'sections': ['designed_for', 'use_cases', 'features'],
+            'sections': ('designed_for', 'use_cases', 'features'),
             'reasoning': 'Usage environment guides customer suitability assessment.'
         },
         'care': {
-            'sections': ['care_instructions', 'maintenance', 'faq'],
+            'sections': ('care_instructions', 'maintenance', 'faq'),
             'reasoning': 'Care information helps maintain product longevity.'
         },
         'warranty': {
-            'sections': ['warranty_info', 'faq', 'specs_table'],
+            'sections': ('warranty_info', 'faq', 'specs_table'),
             'reasoning': 'Warranty details provide purchase confidence.'
         },
         'rating': {
-            'sections': ['specs_table', 'features'],
+            'sections': ('specs_table', 'features'),
             'reasoning': 'Power/efficiency ratings are key specifications.'
         }
     }
 
-    def __init__(self):
-        """Initialize the hybrid entity extractor."""
+    # Dispatch table derived from PLACEMENT_RULES: immutable section tuples
+    # so the per-entity lookup is one dict access and the class-level lists
+    # can never be mutated by appending LLM suggestions.
+    _PLACEMENT_BY_TYPE = {
+        entity_type: (rules['sections'], rules['reasoning'])
+        for entity_type, rules in PLACEMENT_RULES.items()
+    }
+
+    _DEFAULT_PLACEMENT = (('specs_table',), 'Appropriate PDP section based on entity type.')
+
+    # Placement rules for the simple/legacy format, previously rebuilt as a
+    # dict of fresh lists on every _create_placement_map_simple call
+    _SIMPLE_PLACEMENT_RULES = {
+        'material': {
+            'sections': ('specs_table', 'features', 'care_instructions'),
+            'reasoning': 'Material information belongs in specifications and care guidance.'
+        },
+        'standard': {
+            'sections': ('specs_table', 'certifications', 'faq'),
+            'reasoning': 'Certifications should be clearly listed.'
+        },
+        'environment': {
+            'sections': ('designed_for', 'use_cases', 'features'),
+            'reasoning': 'Usage environment guides suitability assessment.'
+        },
+        'care': {
+            'sections': ('care_instructions', 'maintenance', 'faq'),
+            'reasoning': 'Care information helps maintain product longevity.'
+        }
+    }
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None):
+        """Initialize the hybrid entity extractor.
+
+        Args:
+            executor: Optional thread pool for offloading CPU-bound rules and
+                merge work in the async paths. Defaults to asyncio's shared
+                to_thread pool.
+        """
         self.rules_engine = EntityRulesEngine()
         self.llm_extractor = EntityLLMExtractor()
         self.merger = EntityMerger()
+        self._executor = executor
+
+        # Brand cleaning is deterministic for a fixed brand list, and the same
+        # paths/names recur across batch entries, so memoize the hot cleaners.
+        self._clean_entity_path = lru_cache(maxsize=4096)(self.merger.clean_entity_path)
+        self._clean_product_name = lru_cache(maxsize=4096)(self.merger.clean_product_name)
 
         # Get threshold from config if available
         self.confidence_threshold = getattr(
@@ -129,6 +447,19 @@ class EntityExtractor:
 
         logger.info(f"EntityExtractor initialized (threshold={self.confidence_threshold})")
 
+    async def _offload(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        """Run CPU-bound sync work off the event loop.
+
+        Uses the injected executor when one was provided, otherwise falls
+        back to asyncio.to_thread's shared pool.
+        """
+        if self._executor is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, partial(func, *args, **kwargs)
+            )
+        return await asyncio.to_thread(func, *args, **kwargs)
+
     def extract_entities(
         self,
         product_id: str,
@@ -156,7 +487,8 @@ class EntityExtractor:
 
         # Step 1: Clean + group TF-IDF terms in a single LLM call
         grouped_terms, noise_terms = self._clean_and_group_terms(tfidf_terms, search_query=search_query)
-        logger.info(f"Grouped {sum(len(v) for v in grouped_terms.values())} terms, {len(noise_terms)} noise")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Grouped {sum(len(v) for v in grouped_terms.values())} terms, {len(noise_terms)} noise")
 
         # Step 3: Run rules extraction (pass search_query for context-aware filtering)
         rules_result = self.rules_engine.extract(
@@ -167,26 +499,16 @@ class EntityExtractor:
         )
         audit.notes.extend(rules_result.notes)
 
-        # Step 4: Determine if LLM should be invoked
+        # Step 4/5: Determine if LLM should be invoked and run it
         llm_result: Optional[LLMExtractionResult] = None
 
-        should_invoke, invoke_reason = self.llm_extractor.should_invoke(
-            rules_confidence=rules_result.confidence,
-            missing_types=rules_result.missing_types,
-            threshold=self.confidence_threshold,
-            critical_types=self.CRITICAL_TYPES
-        )
-
-        if force_llm:
-            should_invoke = True
-            invoke_reason = "Forced by request"
+        should_invoke, invoke_reason = self._decide_llm(rules_result, force_llm)
 
         if should_invoke:
             audit.llm_invoked = True
             audit.llm_reason = invoke_reason
             logger.info(f"Invoking LLM: {invoke_reason}")
 
-            # Step 5: Run LLM extraction
             # Pass search_query for better context about the product type
             llm_result = self.llm_extractor.extract(
                 product_name=product_name,
@@ -204,6 +526,308 @@ class EntityExtractor:
         else:
             audit.notes.append(f"LLM skipped: {invoke_reason}")
 
+        return self._assemble_result(
+            product_id, product_name, grouped_terms, noise_terms,
+            rules_result, llm_result, audit
+        )
+
+    async def aextract_entities(
+        self,
+        product_id: str,
+        product_name: str,
+        tfidf_terms: List[Dict],
+        product_description: Optional[str] = None,
+        force_llm: bool = False,
+        search_query: Optional[str] = None
+    ) -> HybridEntityExtractionResult:
+        """
+        Async variant of extract_entities.
+
+        The term-grouping LLM call runs concurrently with rules extraction
+        (and, when triggered, gap-filling LLM extraction), overlapping one
+        LLM round trip with the CPU-bound rules pass instead of serializing
+        all three steps.
+
+        Args: same as extract_entities.
+
+        Returns:
+            HybridEntityExtractionResult with full audit trail
+        """
+        audit = AuditInfo()
+
+        # Kick off the term-grouping LLM call, then run rules extraction in a
+        # worker thread while it is in flight.
+        grouping_task = asyncio.create_task(
+            self._aclean_and_group_terms(tfidf_terms, search_query=search_query)
+        )
+
+        try:
+            rules_result = await self._offload(
+                self.rules_engine.extract,
+                product_name=product_name,
+                tfidf_terms=tfidf_terms,
+                description=product_description,
+                search_query=search_query
+            )
+            audit.notes.extend(rules_result.notes)
+
+            llm_result: Optional[LLMExtractionResult] = None
+
+            should_invoke, invoke_reason = self._decide_llm(rules_result, force_llm)
+
+            if should_invoke:
+                audit.llm_invoked = True
+                audit.llm_reason = invoke_reason
+                logger.info(f"Invoking LLM: {invoke_reason}")
+
+                llm_result = await self._offload(
+                    self.llm_extractor.extract,
+                    product_name=product_name,
+                    description=product_description,
+                    tfidf_terms=tfidf_terms,
+                    missing_types=rules_result.missing_types,
+                    existing_entities=rules_result.rule_entities,
+                    search_query=search_query
+                )
+
+                if llm_result.success:
+                    audit.notes.extend(llm_result.notes)
+                else:
+                    audit.notes.append(f"LLM extraction failed: {llm_result.error}")
+            else:
+                audit.notes.append(f"LLM skipped: {invoke_reason}")
+
+            grouped_terms, noise_terms = await grouping_task
+        except BaseException:
+            # Don't abandon the in-flight grouping call when a later step
+            # fails — cancel it and consume its outcome so asyncio never
+            # logs "Task exception was never retrieved".
+            grouping_task.cancel()
+            try:
+                await grouping_task
+            except BaseException:
+                pass
+            raise
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Grouped {sum(len(v) for v in grouped_terms.values())} terms, {len(noise_terms)} noise")
+
+        # Merging and placement mapping are pure CPU work; keep them off the
+        # event loop so concurrent requests are not stalled behind them.
+        return await self._offload(
+            self._assemble_result,
+            product_id, product_name, grouped_terms, noise_terms,
+            rules_result, llm_result, audit
+        )
+
+    async def aextract_entities_batch(
+        self,
+        products: List[Dict],
+        max_concurrency: int = 32
+    ) -> List[Any]:
+        """
+        Extract entities for many products concurrently.
+
+        Each entry in products is a dict of keyword arguments for
+        aextract_entities (product_id, product_name, tfidf_terms, and
+        optional product_description/force_llm/search_query). A semaphore
+        bounds in-flight work so the per-product LLM calls stay within API
+        rate limits while still overlapping across the batch.
+
+        Args:
+            products: List of aextract_entities keyword-argument dicts
+            max_concurrency: Maximum products processed simultaneously
+
+        Returns:
+            List of HybridEntityExtractionResult (or the raised exception,
+            per product) in the same order as products
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(kwargs: Dict) -> Any:
+            async with semaphore:
+                return await self.aextract_entities(**kwargs)
+
+        results = await asyncio.gather(
+            *(_bounded(p) for p in products),
+            return_exceptions=True
+        )
+
+        failures = sum(1 for r in results if isinstance(r, Exception))
+        logger.info(f"Batch extraction complete: {len(results) - failures}/{len(results)} products succeeded")
+
+        return results
+
+    def extract_entities_batch(
+        self,
+        products: List[Dict],
+        completion_window: str = "24h",
+        poll_interval: float = 30.0
+    ) -> List[HybridEntityExtractionResult]:
+        """
+        Extract entities for many products via one OpenAI Batch submission.
+
+        Rules extraction fans out across a thread pool, products needing
+        gap-filling are marshaled into a single Batch API file (half the
+        realtime price), and results are demultiplexed back per product.
+        Blocks while the batch is processed, so this is the cost-optimized
+        pipeline path — latency-critical callers should use
+        aextract_entities_batch instead.
+
+        Args:
+            products: List of extract_entities keyword-argument dicts
+                (product_id, product_name, tfidf_terms, and optional
+                product_description/force_llm/search_query)
+            completion_window: Batch API completion window
+            poll_interval: Seconds between batch status polls
+
+        Returns:
+            List of HybridEntityExtractionResult in input order
+        """
+        return self._extract_many(
+            products,
+            lambda reqs: self.llm_extractor.extract_batch(
+                reqs,
+                completion_window=completion_window,
+                poll_interval=poll_interval
+            )
+        )
+
+    def extract_entities_marshaled(
+        self,
+        products: List[Dict],
+        marshal_size: int = 10
+    ) -> List[HybridEntityExtractionResult]:
+        """
+        Extract entities for many products with marshaled multi-record calls.
+
+        Products needing gap-filling are concatenated marshal_size at a time
+        into single LLM prompts, amortizing the fixed system-prompt and
+        network overhead across records (~marshal_size times fewer calls).
+        Chunks whose responses fail to parse fall back to per-product calls,
+        so results never silently degrade.
+
+        Args:
+            products: List of extract_entities keyword-argument dicts
+            marshal_size: Products per marshaled LLM call
+
+        Returns:
+            List of HybridEntityExtractionResult in input order
+        """
+        return self._extract_many(
+            products,
+            lambda reqs: self.llm_extractor.extract_marshaled(
+                reqs, marshal_size=marshal_size
+            )
+        )
+
+    def _extract_many(
+        self,
+        products: List[Dict],
+        run_llm: Any
+    ) -> List[HybridEntityExtractionResult]:
+        """Shared rules/partition/assemble pipeline for the bulk paths.
+
+        run_llm receives the (custom_id, kwargs) list for products needing
+        gap-filling and returns a custom_id -> LLMExtractionResult mapping.
+        """
+        if not products:
+            return []
+
+        # Rules passes are pure CPU; fan them across threads.
+        with ThreadPoolExecutor(max_workers=min(len(products), 8)) as executor:
+            rules_results = list(executor.map(
+                lambda p: self.rules_engine.extract(
+                    product_name=p['product_name'],
+                    tfidf_terms=p['tfidf_terms'],
+                    description=p.get('product_description'),
+                    search_query=p.get('search_query')
+                ),
+                products
+            ))
+
+        # Partition into needs-LLM vs rules-sufficient.
+        audits: List[AuditInfo] = []
+        llm_requests: List[Tuple[str, Dict]] = []
+        for idx, (product, rules_result) in enumerate(zip(products, rules_results)):
+            audit = AuditInfo()
+            audit.notes.extend(rules_result.notes)
+
+            should_invoke, invoke_reason = self._decide_llm(
+                rules_result, product.get('force_llm', False)
+            )
+            if should_invoke:
+                audit.llm_invoked = True
+                audit.llm_reason = invoke_reason
+                llm_requests.append((str(idx), dict(
+                    product_name=product['product_name'],
+                    description=product.get('product_description'),
+                    tfidf_terms=product['tfidf_terms'],
+                    missing_types=rules_result.missing_types,
+                    existing_entities=rules_result.rule_entities,
+                    search_query=product.get('search_query')
+                )))
+            else:
+                audit.notes.append(f"LLM skipped: {invoke_reason}")
+            audits.append(audit)
+
+        llm_results: Dict[str, LLMExtractionResult] = {}
+        if llm_requests:
+            logger.info(
+                f"Submitting {len(llm_requests)}/{len(products)} products for bulk LLM extraction"
+            )
+            llm_results = run_llm(llm_requests)
+
+        # Assemble per-product results. Term grouping goes through the
+        # normal chunked/cached path.
+        output: List[HybridEntityExtractionResult] = []
+        for idx, (product, rules_result) in enumerate(zip(products, rules_results)):
+            audit = audits[idx]
+            llm_result = llm_results.get(str(idx))
+            if llm_result is not None:
+                if llm_result.success:
+                    audit.notes.extend(llm_result.notes)
+                else:
+                    audit.notes.append(f"LLM extraction failed: {llm_result.error}")
+
+            grouped_terms, noise_terms = self._clean_and_group_terms(
+                product['tfidf_terms'], search_query=product.get('search_query')
+            )
+            output.append(self._assemble_result(
+                product['product_id'], product['product_name'],
+                grouped_terms, noise_terms, rules_result, llm_result, audit
+            ))
+
+        return output
+
+    def _decide_llm(
+        self,
+        rules_result: Any,
+        force_llm: bool
+    ) -> Tuple[bool, str]:
+        """Decide whether gap-filling LLM extraction should run."""
+        # A forced run overrides whatever should_invoke would say, so skip
+        # the confidence/missing-type checks entirely.
+        if force_llm:
+            return True, "Forced by request"
+
+        return self.llm_extractor.should_invoke(
+            rules_confidence=rules_result.confidence,
+            missing_types=rules_result.missing_types,
+            threshold=self.confidence_threshold,
+            critical_types=self.CRITICAL_TYPES
+        )
+
+    def _assemble_result(
+        self,
+        product_id: str,
+        product_name: str,
+        grouped_terms: Dict[str, List[str]],
+        noise_terms: List[str],
+        rules_result: Any,
+        llm_result: Optional[LLMExtractionResult],
+        audit: AuditInfo
+    ) -> HybridEntityExtractionResult:
+        """Merge rules + LLM output and build the final result."""
         # Step 6: Merge results
         llm_entities = llm_result.llm_entities if llm_result and llm_result.success else []
         llm_confidence = llm_result.confidence if llm_result and llm_result.success else 0.0
@@ -233,7 +857,7 @@ class EntityExtractor:
         )
 
         # Clean product name (remove brand names for generic output)
-        clean_product_name = self.merger.clean_product_name(product_name)
+        clean_product_name = self._clean_product_name(product_name)
 
         # Build final result
         result = HybridEntityExtractionResult(
@@ -302,9 +926,9 @@ class EntityExtractor:
         placement_map = self._create_placement_map_simple(supporting_entities, grouped_terms)
 
         # Clean product name and entity path (remove brand names)
-        clean_product_name = self.merger.clean_product_name(product_name)
+        clean_product_name = self._clean_product_name(product_name)
         primary_path = rules_result.primary_entity_path or f"Product > {clean_product_name.title()}"
-        primary_path = self.merger.clean_entity_path(primary_path)
+        primary_path = self._clean_entity_path(primary_path)
 
         return EntityExtractionResult(
             product_id=product_id,
@@ -335,13 +959,7 @@ class EntityExtractor:
         Returns:
             Tuple of (grouped_terms dict, noise_terms list)
         """
-        # Extract phrases from term data
-        phrases = []
-        for term_data in tfidf_terms:
-            phrase = term_data.get('phrase', '').strip()
-            if phrase:
-                phrases.append(phrase)
-
+        phrases = _phrases_from_tfidf(tfidf_terms)
         if not phrases:
             return {}, []
 
@@ -353,9 +971,28 @@ class EntityExtractor:
             except Exception as e:
                 logger.warning(f"LLM clean+group failed, using fallback: {e}")
 
-        # Fallback: all terms go to Core Attributes, no noise detected
         logger.info("Using fallback term grouping (LLM unavailable)")
-        return {"Core Attributes": phrases}, []
+        return _fallback_group_terms(phrases)
+
+    async def _aclean_and_group_terms(
+        self,
+        tfidf_terms: List[Dict],
+        search_query: Optional[str] = None
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Async variant of _clean_and_group_terms using AsyncOpenAI."""
+        phrases = _phrases_from_tfidf(tfidf_terms)
+        if not phrases:
+            return {}, []
+
+        client = _get_async_openai_client()
+        if client and OPENAI_AVAILABLE:
+            try:
+                return await self._aclean_and_group_with_llm(client, phrases, search_query)
+            except Exception as e:
+                logger.warning(f"LLM clean+group failed, using fallback: {e}")
+
+        logger.info("Using fallback term grouping (LLM unavailable)")
+        return _fallback_group_terms(phrases)
 
     def _clean_and_group_with_llm(
         self,
@@ -364,81 +1001,199 @@ class EntityExtractor:
         search_query: Optional[str] = None
     ) -> Tuple[Dict[str, List[str]], List[str]]:
         """
-        Single LLM call to filter noise AND categorize TF-IDF terms.
+        LLM-powered noise filtering AND categorization of TF-IDF terms.
 
         Replaces the previous two-call approach (_clean_terms_with_llm + _group_terms_with_llm).
+        Long term lists are split into windows of _GROUPING_CHUNK_SIZE and
+        processed in parallel rather than truncated, so terms past the first
+        150 still get categorized.
         """
-        # Limit phrases for API efficiency
-        phrases_to_process = phrases[:150]
-
-        context = f'Product search: "{search_query}"' if search_query else "General product"
-
-        prompt = f"""You are a product data analyst. Filter and categorize these TF-IDF terms extracted from product listings.
-
-{context}
-
-Terms to process:
-{json.dumps(phrases_to_process)}
+        chunks = [
+            phrases[i:i + _GROUPING_CHUNK_SIZE]
+            for i in range(0, len(phrases), _GROUPING_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._group_chunk_with_llm(client, chunks[0], search_query)
+
+        logger.info(f"Grouping {len(phrases)} terms across {len(chunks)} LLM calls")
+        with ThreadPoolExecutor(max_workers=min(len(chunks), 8)) as executor:
+            results = list(executor.map(
+                lambda chunk: self._group_chunk_with_llm(client, chunk, search_query),
+                chunks,
+            ))
+        return _merge_grouping_results(results)
 
-STEP 1 - FILTER: Remove all terms that are NOT product attributes:
-- Shipping/delivery (free delivery, standard shipping, express, dispatch, orders)
-- Store/website names (any brand or retailer names)
-- Pricing (price, sale, discount, offer, cheap, affordable)
-- Generic marketing (best, top, new, popular, trending, must-have)
-- Return/exchange policies (returned, exchanged, refund)
-- Location/availability (australia, online, in stock, available)
-- Sizing systems alone (au, us, uk) unless with actual size
-- Random noise or incomplete phrases
-Be aggressive - when in doubt, remove it.
+    def _group_chunk_with_llm(
+        self,
+        client: Any,
+        phrases_to_process: List[str],
+        search_query: Optional[str] = None
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Run the clean+group call for a single chunk of at most 150 terms."""
+        model = getattr(Config, 'ENTITY_LLM_MODEL', 'gpt-4o-mini')
 
-STEP 2 - CATEGORIZE: Put each remaining term into ONE of these groups:
-1. "Core Attributes" - Physical properties: size, dimensions, materials, colors, patterns, design features, fabric types, fits, styles
-2. "Functional Terms" - Performance & benefits: durability, resistance, breathability, stretch, comfort, technical features
-3. "Care Instructions" - Maintenance: washing, cleaning, ironing, drying instructions
-4. "Compliance / Standards" - Certifications, safety standards, warranties (NOT shipping/delivery)
+        cache_key = _grouping_cache_key(phrases_to_process, search_query, model)
+        cached = _GROUPING_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Clean+group cache hit, skipping LLM call")
+            return cached
 
-All filtered-out terms go in "Noise".
+        request_kwargs = self._grouping_request_kwargs(
+            model, phrases_to_process, search_query, cache_key
+        )
 
-IMPORTANT RULES:
-- Color names and patterns (e.g., "marle", "leo water", "stripe") go in "Core Attributes"
-- Shipping/delivery terms go in "Noise" (e.g., "free delivery", "standard delivery")
-- Care-related terms go in "Care Instructions" (e.g., "machine wash", "cold wash")
-- Only actual certifications/standards go in "Compliance / Standards" (e.g., "ISO", "OEKO-TEX")
+        try:
+            if len(phrases_to_process) >= _GROUPING_STREAM_THRESHOLD:
+                # Large payloads: consume the completion as it is generated
+                # instead of waiting for the full response object.
+                parts = []
+                for event in client.chat.completions.create(
+                    stream=True, **request_kwargs
+                ):
+                    delta = event.choices[0].delta.content if event.choices else None
+                    if delta:
+                        parts.append(delta)
+                content = "".join(parts).strip()
+            else:
+                response = client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content.strip()
 
-Return ONLY valid JSON in this exact format:
-{{"Core Attributes": ["term1", "term2"], "Functional Terms": ["term3"], "Care Instructions": ["term4"], "Compliance / Standards": ["term5"], "Noise": ["term6", "term7"]}}
+            grouped, noise = self._parse_grouping_response(content, len(phrases_to_process))
+            _GROUPING_CACHE[cache_key] = (grouped, noise)
+            return grouped, noise
 
-Include ALL terms from the input. Empty categories should be empty arrays []."""
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse LLM clean+group response: {e}")
+            raise
+        except Exception as e:
+            logger.warning(f"LLM clean+group API call failed: {e}")
+            raise
 
-        try:
-            response = client.chat.completions.create(
-                model=getattr(Config, 'ENTITY_LLM_MODEL', 'gpt-4o-mini'),
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
-                max_tokens=2000
-            )
+    def _grouping_request_kwargs(
+        self,
+        model: str,
+        phrases_to_process: List[str],
+        search_query: Optional[str],
+        cache_key: str,
+        seed_offset: int = 0
+    ) -> Dict[str, Any]:
+        """Build the chat.completions arguments for a clean+group chunk.
+
+        seed_offset perturbs the deterministic seed so majority-vote calls
+        draw independent samples instead of K copies of one completion.
+        """
+        return dict(
+            model=model,
+            messages=[
+                {"role": "system", "content": _GROUP_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": self._build_grouping_prompt(phrases_to_process, search_query),
+                },
+            ],
+            response_format={"type": "json_object"},
+            # Deterministic settings: identical inputs reproduce the same
+            # categorization, which is what makes _GROUPING_CACHE useful.
+            # Slightly less creative grouping is fine for a filter task.
+            temperature=0,
+            seed=int(cache_key[:8], 16) + seed_offset,
+            max_tokens=2000,
+        )
 
-            content = response.choices[0].message.content.strip()
+    async def _aclean_and_group_with_llm(
+        self,
+        client: Any,
+        phrases: List[str],
+        search_query: Optional[str] = None
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Async variant of _clean_and_group_with_llm.
 
-            # Handle markdown code blocks
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-                content = content.strip()
+        Fans chunks out with asyncio.gather so N windows cost one round trip.
+        """
+        chunks = [
+            phrases[i:i + _GROUPING_CHUNK_SIZE]
+            for i in range(0, len(phrases), _GROUPING_CHUNK_SIZE)
+        ]
+        if len(chunks) == 1:
+            return await self._agroup_chunk_with_llm(client, chunks[0], search_query)
 
-            result = json.loads(content)
+        logger.info(f"Grouping {len(phrases)} terms across {len(chunks)} LLM calls")
+        results = await asyncio.gather(*(
+            self._agroup_chunk_with_llm(client, chunk, search_query)
+            for chunk in chunks
+        ))
+        return _merge_grouping_results(list(results))
 
-            # Extract noise terms
-            noise = result.pop("Noise", [])
+    async def _agroup_chunk_with_llm(
+        self,
+        client: Any,
+        phrases_to_process: List[str],
+        search_query: Optional[str] = None
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Async variant of _group_chunk_with_llm.
 
-            # Remove empty categories
-            grouped = {k: v for k, v in result.items() if v}
+        When Config.GROUPING_VOTE_K > 1, fires K independent calls in
+        parallel and keeps only categorizations agreed by a majority,
+        trading a little extra spend for lower misclassification noise.
+        """
+        model = getattr(Config, 'ENTITY_LLM_MODEL', 'gpt-4o-mini')
+
+        cache_key = _grouping_cache_key(phrases_to_process, search_query, model)
+        cached = _GROUPING_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("Clean+group cache hit, skipping LLM call")
+            return cached
+
+        vote_k = max(1, getattr(Config, 'GROUPING_VOTE_K', 1))
+        if vote_k > 1:
+            # Each vote gets a distinct seed; with a shared seed the
+            # temperature-0 calls would return K identical samples.
+            results = await asyncio.gather(*(
+                self._arequest_grouping(
+                    client,
+                    self._grouping_request_kwargs(
+                        model, phrases_to_process, search_query, cache_key,
+                        seed_offset=vote
+                    ),
+                    len(phrases_to_process)
+                )
+                for vote in range(vote_k)
+            ))
+            grouped, noise = _majority_vote_grouping(list(results))
+            logger.info(f"Majority vote over {vote_k} grouping calls complete")
+        else:
+            grouped, noise = await self._arequest_grouping(
+                client,
+                self._grouping_request_kwargs(
+                    model, phrases_to_process, search_query, cache_key
+                ),
+                len(phrases_to_process)
+            )
 
-            total_grouped = sum(len(v) for v in grouped.values())
-            logger.info(f"LLM clean+group: {len(phrases_to_process)} terms → {total_grouped} grouped, {len(noise)} noise (1 API call)")
+        _GROUPING_CACHE[cache_key] = (grouped, noise)
+        return grouped, noise
 
-            return grouped, noise
+    async def _arequest_grouping(
+        self,
+        client: Any,
+        request_kwargs: Dict[str, Any],
+        term_count: int
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Issue one async clean+group request and parse its response."""
+        try:
+            if term_count >= _GROUPING_STREAM_THRESHOLD:
+                parts = []
+                async for event in await client.chat.completions.create(
+                    stream=True, **request_kwargs
+                ):
+                    delta = event.choices[0].delta.content if event.choices else None
+                    if delta:
+                        parts.append(delta)
+                content = "".join(parts).strip()
+            else:
+                response = await client.chat.completions.create(**request_kwargs)
+                content = response.choices[0].message.content.strip()
+            return self._parse_grouping_response(content, term_count)
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse LLM clean+group response: {e}")
@@ -447,6 +1202,55 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
             logger.warning(f"LLM clean+group API call failed: {e}")
             raise
 
+    def _build_grouping_prompt(
+        self,
+        phrases_to_process: List[str],
+        search_query: Optional[str] = None
+    ) -> str:
+        """Build the variable user message for the clean+group call.
+
+        The constant instructions live in _GROUP_SYSTEM_PROMPT; only the
+        search context and term list change between calls.
+        """
+        context = f'Product search: "{search_query}"' if search_query else "General product"
+
+        return f"""{context}
+
+Terms to process:
+{_json_dumps(phrases_to_process)}"""
+
+    def _parse_grouping_response(
+        self,
+        content: str,
+        term_count: int
+    ) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Parse the clean+group JSON response into (grouped, noise)."""
+        result = _json_loads(content)
+
+        # Extract noise terms
+        noise = result.pop("Noise", [])
+
+        # Remove empty categories
+        grouped = {k: v for k, v in result.items() if v}
+
+        total_grouped = sum(len(v) for v in grouped.values())
+        logger.info(f"LLM clean+group: {term_count} terms → {total_grouped} grouped, {len(noise)} noise (1 API call)")
+
+        return grouped, noise
+
+    # Prefix the rules engine uses to flag a low-confidence path
+    _UNCERTAIN_PREFIX = "Product >"
+
+    @classmethod
+    def _path_is_uncertain(cls, path: Optional[str]) -> bool:
+        """True when a path is missing or flagged low-confidence by rules."""
+        return not path or path.startswith(cls._UNCERTAIN_PREFIX)
+
+    @classmethod
+    def _path_has_confident_category(cls, path: Optional[str]) -> bool:
+        """True when a path names a real category rather than a placeholder."""
+        return bool(path) and not path.startswith(cls._UNCERTAIN_PREFIX) and "Unknown" not in path
+
     def _determine_primary_entity_path(
         self,
         rules_path: Optional[str],
@@ -461,18 +1265,8 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
         - If rules returns "Product > <something>" but LLM has a better path, prefer LLM
         - Fall back to rules path if nothing else works
         """
-        # Check if rules path indicates low confidence
-        rules_uncertain = (
-            not rules_path or
-            rules_path.startswith("Product >")
-        )
-
-        # Check if LLM provided a confident category
-        llm_has_category = (
-            llm_path and
-            not llm_path.startswith("Product >") and
-            "Unknown" not in llm_path
-        )
+        rules_uncertain = self._path_is_uncertain(rules_path)
+        llm_has_category = self._path_has_confident_category(llm_path)
 
         if not rules_uncertain:
             # Rules has a confident category match
@@ -486,7 +1280,7 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
             path = rules_path or "Product > Unknown"
 
         # Clean brand names from the path
-        path = self.merger.clean_entity_path(path)
+        path = self._clean_entity_path(path)
         return path
 
     def _create_placement_map(
@@ -497,23 +1291,40 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
     ) -> List[PlacementRecommendation]:
         """Create placement recommendations for entities."""
         placements = []
-        seen_entities = set()
 
-        # Add placements for each entity
+        # Invert llm_suggestions once (name -> sections) so the entity loop
+        # does a single dict lookup instead of scanning every section's name
+        # list per entity.
+        name_to_sections: Dict[str, List[str]] = {}
+        if llm_suggestions:
+            for section, names in llm_suggestions.items():
+                for name in names:
+                    name_to_sections.setdefault(name, []).append(section)
+
+        # Deduplicate by name up front (first occurrence wins) instead of
+        # tracking a seen-set inside the loop
+        unique_entities: Dict[str, EntityItem] = {}
         for entity in entities:
-            if entity.name in seen_entities:
-                continue
-            seen_entities.add(entity.name)
-
-            rules = self.PLACEMENT_RULES.get(entity.entity_type, {})
-            sections = rules.get('sections', ['specs_table'])
-            reasoning = rules.get('reasoning', 'Appropriate PDP section based on entity type.')
-
-            # Check LLM suggestions
-            if llm_suggestions:
-                for section, names in llm_suggestions.items():
-                    if entity.name in names and section not in sections:
+            unique_entities.setdefault(entity.name, entity)
+
+        # Add placements for each entity
+        for entity in unique_entities.values():
+            base_sections, reasoning = self._PLACEMENT_BY_TYPE.get(
+                entity.entity_type, self._DEFAULT_PLACEMENT
+            )
+
+            # Copy to a list only when LLM suggestions actually extend the
+            # base sections; otherwise share the immutable tuple.
+            suggested = name_to_sections.get(entity.name)
+            if suggested:
+                sections = list(base_sections)
+                section_set = set(sections)
+                for section in suggested:
+                    if section not in section_set:
+                        section_set.add(section)
                         sections.append(section)
+            else:
+                sections = base_sections
 
             placements.append(PlacementRecommendation(
                 entity_name=entity.name,
@@ -524,28 +1335,13 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
 
         # Add category-level recommendations
         if 'Core Attributes' in grouped_terms:
-            placements.append(PlacementRecommendation(
-                entity_name='Specifications',
-                entity_type='core_attributes',
-                recommended_sections=['specs_table'],
-                reasoning='Core attribute terms should populate the specifications table.'
-            ))
+            placements.append(_CAT_SPECS)
 
         if 'Functional Terms' in grouped_terms:
-            placements.append(PlacementRecommendation(
-                entity_name='Features & Benefits',
-                entity_type='functional_terms',
-                recommended_sections=['features', 'hero_copy'],
-                reasoning='Functional advantages highlight key benefits.'
-            ))
+            placements.append(_CAT_FEATURES)
 
         if 'Usage Context' in grouped_terms:
-            placements.append(PlacementRecommendation(
-                entity_name='Designed For',
-                entity_type='usage_context',
-                recommended_sections=['designed_for', 'use_cases'],
-                reasoning='Usage context helps customers assess suitability.'
-            ))
+            placements.append(_CAT_USAGE)
 
         return placements
 
@@ -557,49 +1353,34 @@ Include ALL terms from the input. Empty categories should be empty arrays []."""
         """Create placement map for simple/legacy format."""
         placements = []
 
-        simple_rules = {
-            'material': {
-                'sections': ['specs_table', 'features', 'care_instructions'],
-                'reasoning': 'Material information belongs in specifications and care guidance.'
-            },
-            'standard': {
-                'sections': ['specs_table', 'certifications', 'faq'],
-                'reasoning': 'Certifications should be clearly listed.'
-            },
-            'environment': {
-                'sections': ['designed_for', 'use_cases', 'features'],
-                'reasoning': 'Usage environment guides suitability assessment.'
-            },
-            'care': {
-                'sections': ['care_instructions', 'maintenance', 'faq'],
-                'reasoning': 'Care information helps maintain product longevity.'
-            }
-        }
-
         for entity in entities:
-            rules = simple_rules.get(entity.entity_type, {})
+            rules = self._SIMPLE_PLACEMENT_RULES.get(entity.entity_type, {})
             placements.append(PlacementRecommendation(
                 entity_name=entity.name,
                 entity_type=entity.entity_type,
-                recommended_sections=rules.get('sections', []),
+                recommended_sections=rules.get('sections', ()),
                 reasoning=rules.get('reasoning', 'Appropriate PDP section.')
             ))
 
         # Category recommendations
         if 'Core Attributes' in grouped_terms:
-            placements.append(PlacementRecommendation(
-                entity_name='Specifications',
-                entity_type='core_attributes',
-                recommended_sections=['specs_table'],
-                reasoning='Core attributes populate specifications.'
-            ))
+            placements.append(_CAT_SPECS_SIMPLE)
 
         if 'Functional Terms' in grouped_terms:
-            placements.append(PlacementRecommendation(
-                entity_name='Features & Benefits',
-                entity_type='functional_terms',
-                recommended_sections=['features', 'hero_copy'],
-                reasoning='Functional terms highlight benefits.'
-            ))
+            placements.append(_CAT_FEATURES_SIMPLE)
 
         return placements
+
+
+@lru_cache(maxsize=1)
+def get_entity_extractor() -> EntityExtractor:
+    """Return the shared EntityExtractor instance.
+
+    Preferred entry point for pipeline code: constructing an extractor
+    builds the rules engine, LLM extractor and merger (each compiling its
+    own patterns), so the one-time cost is amortized across all products
+    a worker processes. Instantiate EntityExtractor() directly only when
+    isolation is needed (e.g. in tests). Reset with
+    get_entity_extractor.cache_clear().
+    """
+    return EntityExtractor()
@@ -6,8 +6,13 @@ Combines TF-IDF and spaCy results into a unified SEO phrase list.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Dict, Set, Optional, Literal
+import heapq
 import re
+import sys
+
+import numpy as np
 
 from .tfidf_extractor import TFIDFPhrase
 from .spacy_extractor import NounPhrase
@@ -15,8 +20,37 @@ from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+# Single precompiled suffix-stripping pattern for _get_phrase_root: one
+# C-level pass over the whole phrase with \b word boundaries. Alternation
+# order mirrors the old two-pass behaviour — ies -> y, then -ing/-ed with
+# their plural compounds (-ings/-inges/-eds/-edes, which the sequential
+# passes stripped in two steps), then -es (words of 5+), then -s (words of
+# 4+, not -ss). Lookbehinds encode the minimum-length guards.
+_ROOT_RE = re.compile(
+    r'ies\b'
+    r'|(?<=\w{3})(?:ing|ed)(?:e?s)?\b'
+    r'|(?<=\w{3})es\b'
+    r'|(?<=\w\w[^s])s\b'
+)
 
-@dataclass
+
+def _strip_suffix(match: re.Match) -> str:
+    return 'y' if match.group() == 'ies' else ''
+
+
+@lru_cache(maxsize=None)
+def _phrase_root(phrase: str) -> str:
+    """Memoized root form; many phrases share suffix work across merges."""
+    return _ROOT_RE.sub(_strip_suffix, phrase)
+
+
+# Normalization patterns for _normalize_for_matching, hoisted so the
+# per-phrase calls skip re's pattern-cache lookup.
+_WS_RE = re.compile(r'\s+')
+_TRIM_RE = re.compile(r'^[^\w]+|[^\w]+$')
+
+
+@dataclass(slots=True)
 class SEOPhrase:
     """A merged SEO phrase from multiple extraction sources."""
     phrase: str
@@ -64,7 +98,8 @@ class KeywordMerger:
         self,
         tfidf_phrases: List[TFIDFPhrase],
         spacy_phrases: List[NounPhrase],
-        total_docs: int
+        total_docs: int,
+        top_k: Optional[int] = None
     ) -> List[SEOPhrase]:
         """
         Merge phrases from both extraction methods.
@@ -73,6 +108,8 @@ class KeywordMerger:
             tfidf_phrases: Phrases from TF-IDF extraction
             spacy_phrases: Phrases from spaCy extraction
             total_docs: Total number of documents in corpus
+            top_k: If set, return only the K highest-scoring phrases
+                (selected in O(N log K) instead of a full sort)
 
         Returns:
             Merged and deduplicated list of SEOPhrase objects
@@ -80,50 +117,72 @@ class KeywordMerger:
         logger.info("Merging %d TF-IDF phrases with %d spaCy phrases",
                    len(tfidf_phrases), len(spacy_phrases))
 
-        # Normalize phrases for matching
-        merged: Dict[str, SEOPhrase] = {}
-
-        # Process TF-IDF phrases first
+        # Groupby-max keyed by normalized phrase, with the running maxes
+        # folded into the indexing pass — no intermediate per-group lists
+        # and no repeated generator-based max() calls. Record layout:
+        # [phrase, doc_freq, total_occurrences, tfidf_score].
+        tfidf_agg: Dict[str, List] = {}
         for phrase in tfidf_phrases:
             normalized = self._normalize_for_matching(phrase.phrase)
             if not normalized:
                 continue
-
-            if normalized not in merged:
-                merged[normalized] = SEOPhrase(
-                    phrase=phrase.phrase,
-                    doc_freq=phrase.doc_freq,
-                    total_occurrences=phrase.total_occurrences,
-                    tfidf_score=phrase.tfidf_score,
-                    source='tfidf'
-                )
+            record = tfidf_agg.get(normalized)
+            if record is None:
+                tfidf_agg[normalized] = [
+                    phrase.phrase, phrase.doc_freq,
+                    phrase.total_occurrences, phrase.tfidf_score,
+                ]
             else:
-                # Update existing entry
-                existing = merged[normalized]
-                existing.doc_freq = max(existing.doc_freq, phrase.doc_freq)
-                existing.total_occurrences = max(existing.total_occurrences, phrase.total_occurrences)
-                existing.tfidf_score = max(existing.tfidf_score, phrase.tfidf_score)
-
-        # Process spaCy phrases
+                if phrase.doc_freq > record[1]:
+                    record[1] = phrase.doc_freq
+                if phrase.total_occurrences > record[2]:
+                    record[2] = phrase.total_occurrences
+                if phrase.tfidf_score > record[3]:
+                    record[3] = phrase.tfidf_score
+
+        spacy_agg: Dict[str, List] = {}
         for phrase in spacy_phrases:
             normalized = self._normalize_for_matching(phrase.phrase)
             if not normalized:
                 continue
-
-            if normalized not in merged:
-                merged[normalized] = SEOPhrase(
-                    phrase=phrase.phrase,
-                    doc_freq=phrase.doc_freq,
-                    total_occurrences=phrase.total_occurrences,
-                    tfidf_score=0.0,
-                    source='spacy'
-                )
+            record = spacy_agg.get(normalized)
+            if record is None:
+                spacy_agg[normalized] = [
+                    phrase.phrase, phrase.doc_freq, phrase.total_occurrences,
+                ]
             else:
-                # Update existing entry - mark as 'both' sources
-                existing = merged[normalized]
-                existing.source = 'both'
-                existing.doc_freq = max(existing.doc_freq, phrase.doc_freq)
-                existing.total_occurrences = max(existing.total_occurrences, phrase.total_occurrences)
+                if phrase.doc_freq > record[1]:
+                    record[1] = phrase.doc_freq
+                if phrase.total_occurrences > record[2]:
+                    record[2] = phrase.total_occurrences
+
+        merged: Dict[str, SEOPhrase] = {}
+
+        for normalized, record in tfidf_agg.items():
+            doc_freq = record[1]
+            total_occurrences = record[2]
+            spacy_record = spacy_agg.get(normalized)
+            if spacy_record:
+                doc_freq = max(doc_freq, spacy_record[1])
+                total_occurrences = max(total_occurrences, spacy_record[2])
+            merged[normalized] = SEOPhrase(
+                phrase=record[0],
+                doc_freq=doc_freq,
+                total_occurrences=total_occurrences,
+                tfidf_score=record[3],
+                source='both' if spacy_record else 'tfidf'
+            )
+
+        for normalized, record in spacy_agg.items():
+            if normalized in merged:
+                continue
+            merged[normalized] = SEOPhrase(
+                phrase=record[0],
+                doc_freq=record[1],
+                total_occurrences=record[2],
+                tfidf_score=0.0,
+                source='spacy'
+            )
 
         # Also do fuzzy matching for similar phrases
         merged = self._fuzzy_deduplicate(merged)
@@ -132,8 +191,12 @@ class KeywordMerger:
         phrases = list(merged.values())
         self._calculate_importance_scores(phrases, total_docs)
 
-        # Sort by importance
-        phrases.sort(key=lambda p: p.importance_score, reverse=True)
+        # Sort by importance; when only the top K are wanted, a heap
+        # selection avoids sorting the tail
+        if top_k is not None:
+            phrases = heapq.nlargest(top_k, phrases, key=lambda p: p.importance_score)
+        else:
+            phrases.sort(key=lambda p: p.importance_score, reverse=True)
 
         logger.info("Merged into %d unique SEO phrases", len(phrases))
 
@@ -147,16 +210,26 @@ class KeywordMerger:
         # Lowercase
         normalized = phrase.lower().strip()
 
+        # Fast path: single-spaced alphanumeric phrases need no regex cleanup.
+        # Interning collapses the many repeated keys seen across products in
+        # a batch to one string object, so later dict/set lookups hit the
+        # identity fast path.
+        if (
+            '  ' not in normalized
+            and normalized.replace(' ', '').isalnum()
+        ):
+            return sys.intern(normalized) if len(normalized) >= 2 else None
+
         # Remove extra whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
+        normalized = _WS_RE.sub(' ', normalized)
 
         # Remove trailing/leading punctuation
-        normalized = re.sub(r'^[^\w]+|[^\w]+$', '', normalized)
+        normalized = _TRIM_RE.sub('', normalized)
 
         if len(normalized) < 2:
             return None
 
-        return normalized
+        return sys.intern(normalized)
 
     def _fuzzy_deduplicate(self, merged: Dict[str, SEOPhrase]) -> Dict[str, SEOPhrase]:
         """
@@ -164,17 +237,24 @@ class KeywordMerger:
 
         Merges phrases that are very similar (e.g., plural/singular variants).
         """
-        # Group phrases by their root form
+        # Early exits: a single phrase cannot merge, and since the stemmer is
+        # word-local, phrases whose stemmed first words are all distinct
+        # cannot share a root — a cheap memoized scan that short-circuits
+        # the common all-unique case before whole-phrase stemming.
+        if len(merged) < 2:
+            return merged
+        first_roots = {_phrase_root(key.split(' ', 1)[0]) for key in merged}
+        if len(first_roots) == len(merged):
+            return merged
+
+        # Group phrases by their root form in a single setdefault pass
         root_groups: Dict[str, List[str]] = {}
 
         for normalized in merged.keys():
-            # Get a simplified root
-            root = self._get_phrase_root(normalized)
-            if root not in root_groups:
-                root_groups[root] = []
-            root_groups[root].append(normalized)
+            root_groups.setdefault(self._get_phrase_root(normalized), []).append(normalized)
 
-        # Merge phrases within each group
+        # Merge phrases within each group; singleton groups (the common case)
+        # alias the existing entry without any further work
         deduplicated: Dict[str, SEOPhrase] = {}
 
         for root, variants in root_groups.items():
@@ -201,34 +281,12 @@ class KeywordMerger:
         """
         Get a simplified root form for fuzzy matching.
 
-        Handles plural/singular and common suffix variations.
+        Handles plural/singular and common suffix variations. A single
+        precompiled pass stems every word in the phrase at once; the word
+        boundaries in the pattern replace the old split/slice/join loop.
+        Delegates to the memoized module-level helper.
         """
-        words = phrase.split()
-        roots = []
-
-        for word in words:
-            # Simple stemming rules
-            root = word
-
-            # Remove common plural endings
-            if root.endswith('ies'):
-                root = root[:-3] + 'y'
-            elif root.endswith('es') and len(root) > 4:
-                root = root[:-2]
-            elif root.endswith('s') and not root.endswith('ss') and len(root) > 3:
-                root = root[:-1]
-
-            # Remove -ing endings
-            if root.endswith('ing') and len(root) > 5:
-                root = root[:-3]
-
-            # Remove -ed endings
-            if root.endswith('ed') and len(root) > 4:
-                root = root[:-2]
-
-            roots.append(root)
-
-        return ' '.join(roots)
+        return _phrase_root(phrase)
 
     def _calculate_importance_scores(
         self,
@@ -244,33 +302,36 @@ class KeywordMerger:
         if not phrases:
             return
 
-        # Find max values for normalization
-        max_doc_freq = max(p.doc_freq for p in phrases) or 1
-        max_tfidf = max(p.tfidf_score for p in phrases) or 1
-        max_occurrences = max(p.total_occurrences for p in phrases) or 1
-
-        for phrase in phrases:
-            # Normalize individual components
-            norm_doc_freq = phrase.doc_freq / max_doc_freq
-            norm_tfidf = phrase.tfidf_score / max_tfidf if phrase.tfidf_score > 0 else 0
-            norm_occurrences = phrase.total_occurrences / max_occurrences
-
-            # Calculate weighted score
-            score = (
-                self.doc_freq_weight * norm_doc_freq +
-                self.tfidf_weight * norm_tfidf +
-                self.occurrence_weight * norm_occurrences
-            )
-
-            # Bonus for appearing in both sources
-            if phrase.source == 'both':
-                score *= 1.15
-
-            # Scale to 0-100 for readability
-            if self.normalize_scores:
-                phrase.importance_score = min(score * 100, 100)
-            else:
-                phrase.importance_score = score
+        # Gather the numeric columns once (SoA layout) so the weighted sum
+        # runs as vectorized numpy arithmetic instead of per-phrase Python.
+        count = len(phrases)
+        doc_freq = np.fromiter((p.doc_freq for p in phrases), dtype=np.float64, count=count)
+        tfidf = np.fromiter((p.tfidf_score for p in phrases), dtype=np.float64, count=count)
+        occurrences = np.fromiter(
+            (p.total_occurrences for p in phrases), dtype=np.float64, count=count
+        )
+        is_both = np.fromiter((p.source == 'both' for p in phrases), dtype=bool, count=count)
+
+        # Max values for normalization
+        max_doc_freq = doc_freq.max() or 1
+        max_tfidf = tfidf.max() or 1
+        max_occurrences = occurrences.max() or 1
+
+        scores = (
+            self.doc_freq_weight * (doc_freq / max_doc_freq) +
+            self.tfidf_weight * np.where(tfidf > 0, tfidf / max_tfidf, 0.0) +
+            self.occurrence_weight * (occurrences / max_occurrences)
+        )
+
+        # Bonus for appearing in both sources
+        scores[is_both] *= 1.15
+
+        # Scale to 0-100 for readability
+        if self.normalize_scores:
+            scores = np.minimum(scores * 100, 100)
+
+        for phrase, score in zip(phrases, scores.tolist()):
+            phrase.importance_score = score
 
 
 __all__ = ['KeywordMerger', 'SEOPhrase']
@@ -14,14 +14,14 @@ from datetime import datetime
 
 from .text_cleaner import TextCleaner
 from .tfidf_extractor import TFIDFExtractor
-from .spacy_extractor import SpacyExtractor
+from .spacy_extractor import SpacyExtractor, warmup as _spacy_warmup
 from .keyword_merger import KeywordMerger, SEOPhrase
 from ..logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SEOAnalysisResult:
     """Result of SEO analysis on product descriptions."""
     phrases: List[SEOPhrase]
@@ -74,16 +74,19 @@ class SEOAnalysisResult:
             'source'
         ])
 
-        # Data rows
-        for phrase in self.phrases:
-            writer.writerow([
-                phrase.phrase,
-                phrase.doc_freq,
-                phrase.total_occurrences,
-                round(phrase.tfidf_score, 4),
-                round(phrase.importance_score, 2),
-                phrase.source
-            ])
+        # Data rows: one writerows call stays in the C writer loop instead
+        # of a Python writerow call per phrase
+        writer.writerows(
+            (
+                p.phrase,
+                p.doc_freq,
+                p.total_occurrences,
+                round(p.tfidf_score, 4),
+                round(p.importance_score, 2),
+                p.source,
+            )
+            for p in self.phrases
+        )
 
         return output.getvalue()
 
@@ -102,18 +105,23 @@ class SEOAnalysisResult:
         low = []
 
         for phrase in self.phrases:
-            phrase_dict = phrase.to_dict()
             if phrase.importance_score >= 70:
-                high.append(phrase_dict)
+                bucket = high
             elif phrase.importance_score >= 40:
-                medium.append(phrase_dict)
+                bucket = medium
             else:
-                low.append(phrase_dict)
+                bucket = low
+            # Each bucket is capped at 100; once all three are full the
+            # remaining phrases cannot contribute anywhere
+            if len(bucket) < 100:
+                bucket.append(phrase.to_dict())
+            elif len(high) >= 100 and len(medium) >= 100 and len(low) >= 100:
+                break
 
         return {
-            'high_importance': high[:100],
-            'medium_importance': medium[:100],
-            'low_importance': low[:100],
+            'high_importance': high,
+            'medium_importance': medium,
+            'low_importance': low,
         }
 
 
@@ -133,6 +141,11 @@ class SEOAnalyzer:
     # Brand names to exclude (optional)
     brand_names: Set[str] = field(default_factory=set)
 
+    # Feed raw product text straight to spaCy (its tokenizer handles
+    # URLs/punctuation itself and noun chunking works off POS tags), saving
+    # one regex-cleaning pass over the corpus; TF-IDF keeps cleaned text
+    spacy_raw_mode: bool = False
+
     # Component instances
     _text_cleaner: Optional[TextCleaner] = field(default=None, repr=False)
     _tfidf_extractor: Optional[TFIDFExtractor] = field(default=None, repr=False)
@@ -149,10 +162,21 @@ class SEOAnalyzer:
         )
         self._spacy_extractor = SpacyExtractor(
             min_df=self.min_doc_freq,
-            top_n=self.top_n_phrases
+            top_n=self.top_n_phrases,
+            raw_mode=self.spacy_raw_mode
         )
         self._keyword_merger = KeywordMerger()
 
+    @classmethod
+    def warmup(cls) -> bool:
+        """Pre-load the spaCy model at process startup.
+
+        Long-running servers should call this once during initialization so
+        the first analysis request does not pay the model-load latency.
+        Returns whether spaCy is usable.
+        """
+        return _spacy_warmup()
+
     def analyze(self, products: List[Dict[str, Any]]) -> SEOAnalysisResult:
         """
         Perform SEO analysis on product descriptions.
@@ -184,8 +208,17 @@ class SEOAnalyzer:
         tfidf_phrases = self._tfidf_extractor.extract(corpus)
         logger.info("TF-IDF extracted %d phrases", len(tfidf_phrases))
 
-        # Step 3: spaCy extraction
-        spacy_phrases = self._spacy_extractor.extract(corpus)
+        # Step 3: spaCy extraction (raw mode skips the cleaned corpus —
+        # the tokenizer deals with URLs/punctuation itself)
+        if self.spacy_raw_mode:
+            spacy_corpus = [
+                text for text in (
+                    self._text_cleaner.extract_product_text(p) for p in products
+                ) if text
+            ]
+        else:
+            spacy_corpus = corpus
+        spacy_phrases = self._spacy_extractor.extract(spacy_corpus)
         logger.info("spaCy extracted %d phrases", len(spacy_phrases))
 
         # Step 4: Merge results
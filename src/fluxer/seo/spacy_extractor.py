@@ -10,6 +10,9 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Set, Optional
 from collections import Counter
 import re
+import sys
+
+import numpy as np
 
 from ..logger import get_logger
 
@@ -19,42 +22,111 @@ logger = get_logger(__name__)
 _spacy_available = None
 _nlp = None
 
-
-def _check_spacy() -> bool:
-    """Check if spacy is available and load the model."""
-    global _spacy_available, _nlp
-
-    if _spacy_available is not None:
-        return _spacy_available
-
+# Default model configuration; noun chunking needs the tagger, the
+# attribute_ruler (maps fine-grained TAG to the coarse POS that
+# noun_chunks filters on) and the parser — only ner/lemmatizer are spare
+_MODEL_NAME = "en_core_web_sm"
+_EXCLUDED_COMPONENTS = ("ner", "lemmatizer")
+
+# Process-wide registry of loaded pipelines keyed by (model, exclusions) so
+# differently-configured extractors share one ~200MB model load
+_NLP_CACHE: Dict[tuple, Optional[object]] = {}
+
+# Common adjective patterns that often precede nouns (fallback heuristics)
+_FALLBACK_ADJECTIVES = frozenset({
+    'digital', 'automatic', 'electric', 'electronic', 'wireless',
+    'compact', 'portable', 'adjustable', 'removable', 'built-in',
+    'stainless', 'steel', 'glass', 'plastic', 'metal', 'aluminum',
+    'led', 'lcd', 'touch', 'smart', 'high', 'low', 'fast', 'slow',
+    'large', 'small', 'medium', 'mini', 'micro', 'dual', 'triple',
+    'multi', 'single', 'double', 'full', 'half', 'auto', 'manual',
+    'front', 'back', 'side', 'top', 'bottom', 'inner', 'outer',
+    'easy', 'quick', 'safe', 'secure', 'quiet', 'silent', 'powerful',
+})
+
+# Sorted array view for vectorized membership tests (np.isin)
+_FALLBACK_ADJECTIVE_ARRAY = np.array(sorted(_FALLBACK_ADJECTIVES))
+
+# Common technical noun suffixes (fallback heuristics)
+_FALLBACK_NOUN_SUFFIXES = (
+    'tion', 'sion', 'ment', 'ness', 'ity', 'ance', 'ence',
+    'er', 'or', 'ist', 'ism', 'ing', 'age', 'ure', 'ry',
+    'ty', 'al', 'ics', 'ogy', 'logy',
+)
+
+
+def _load_nlp(model_name: str, exclude: tuple) -> Optional[object]:
+    """Load a spaCy pipeline, sharing loads through the process-wide cache."""
+    key = (model_name, tuple(exclude))
+    if key in _NLP_CACHE:
+        return _NLP_CACHE[key]
+
+    nlp = None
     try:
         import spacy
 
         # Try to load English model
         try:
-            _nlp = spacy.load("en_core_web_sm")
-            _spacy_available = True
-            logger.debug("spaCy with en_core_web_sm model loaded")
+            nlp = spacy.load(model_name, exclude=list(exclude))
+            logger.debug("spaCy with %s model loaded", model_name)
         except OSError:
             # Model not installed, try to download it
             logger.warning("spaCy model not found, attempting to download...")
             try:
                 from spacy.cli import download
-                download("en_core_web_sm")
-                _nlp = spacy.load("en_core_web_sm")
-                _spacy_available = True
+                download(model_name)
+                nlp = spacy.load(model_name, exclude=list(exclude))
             except Exception as e:
                 logger.warning("Could not download spaCy model: %s", e)
-                _spacy_available = False
 
     except ImportError:
-        _spacy_available = False
         logger.warning("spaCy not installed. Noun phrase extraction will use fallback.")
 
+    _NLP_CACHE[key] = nlp
+    return nlp
+
+
+def _check_spacy() -> bool:
+    """Check if spacy is available and load the default model."""
+    global _spacy_available, _nlp
+
+    if _spacy_available is not None:
+        return _spacy_available
+
+    _nlp = _load_nlp(_MODEL_NAME, _EXCLUDED_COMPONENTS)
+    _spacy_available = _nlp is not None
+
     return _spacy_available
 
 
-@dataclass
+def warmup() -> bool:
+    """Eagerly load the spaCy model.
+
+    Call at process startup so long-running servers pay the multi-second
+    model load once instead of on the first analysis request. Returns
+    whether spaCy is usable.
+    """
+    return _check_spacy()
+
+
+def _top_by_frequency(phrases: List['NounPhrase'], top_n: int) -> List['NounPhrase']:
+    """Select the top_n phrases by (doc_freq, total_occurrences) descending.
+
+    Sorting runs as a numpy lexsort over two int columns instead of a
+    Python list.sort with a per-compare lambda tuple.
+    """
+    count = len(phrases)
+    if count <= 1:
+        return phrases
+    doc_freqs = np.fromiter((p.doc_freq for p in phrases), dtype=np.int64, count=count)
+    totals = np.fromiter(
+        (p.total_occurrences for p in phrases), dtype=np.int64, count=count
+    )
+    order = np.lexsort((-totals, -doc_freqs))
+    return [phrases[i] for i in order[:top_n]]
+
+
+@dataclass(slots=True)
 class NounPhrase:
     """A noun phrase extracted via spaCy."""
     phrase: str
@@ -84,6 +156,17 @@ class SpacyExtractor:
     # Top N phrases to return (aligned with SEO analyzer default)
     top_n: int = 200
 
+    # Documents per spaCy batch; larger batches amortize pipeline overhead
+    batch_size: int = 256
+
+    # Worker processes for nlp.pipe. Values > 1 use multiprocessing (spawn),
+    # so only raise this from code guarded by `if __name__ == "__main__"`.
+    n_process: int = 1
+
+    # When feeding raw (uncleaned) text, filter URL/email noise at the
+    # token level instead of relying on upstream regex cleaning
+    raw_mode: bool = False
+
     # Stopwords to strip from phrase edges
     edge_stopwords: Set[str] = field(default_factory=lambda: {
         'the', 'a', 'an', 'this', 'that', 'these', 'those',
@@ -103,8 +186,39 @@ class SpacyExtractor:
     ])
 
     def __post_init__(self) -> None:
-        """Initialize compiled patterns."""
-        self._skip_patterns = [re.compile(p, re.IGNORECASE) for p in self.skip_patterns]
+        """Initialize compiled patterns and lookup structures."""
+        # Fold the skip patterns into one anchored alternation so the
+        # per-chunk filter is a single C-level match instead of a Python
+        # loop over separate compiled patterns
+        self._skip_re = re.compile(
+            '^(?:' + '|'.join(
+                f'(?:{p[1:-1] if p.startswith("^") and p.endswith("$") else p})'
+                for p in self.skip_patterns
+            ) + ')$',
+            re.IGNORECASE,
+        )
+
+        # Precompiled normalization patterns and a frozenset copy of the
+        # edge stopwords: _normalize_phrase runs once per noun chunk, so
+        # pattern-cache lookups and set construction are hoisted out of it
+        self._edge_punct_re = re.compile(r'^[^\w]+|[^\w]+$')
+        self._edge_stop_fs = frozenset(self.edge_stopwords)
+
+        # Specialize the chunk-accept predicate with the configured
+        # thresholds and pattern bound as closure cells — cheaper than
+        # repeated instance attribute loads in the per-chunk loop. The
+        # normalized phrase is single-spaced, so count(' ') + 1 gives the
+        # word count without building a list.
+        min_length = self.min_length
+        max_words = self.max_words
+        skip_match = self._skip_re.match
+
+        def _accept(normalized: str) -> bool:
+            if len(normalized) < min_length or normalized.count(' ') + 1 > max_words:
+                return False
+            return skip_match(normalized) is None
+
+        self._accept = _accept
 
     def extract(self, corpus: List[str]) -> List[NounPhrase]:
         """
@@ -130,51 +244,55 @@ class SpacyExtractor:
         logger.info("Starting spaCy noun phrase extraction on %d documents", len(corpus))
 
         phrase_counts: Counter = Counter()
-        phrase_docs: Dict[str, Set[int]] = {}
+        phrase_doc_freq: Counter = Counter()
         phrase_roots: Dict[str, str] = {}
 
-        # Process documents in batches for efficiency
-        batch_size = 100
-        for batch_start in range(0, len(corpus), batch_size):
-            batch = corpus[batch_start:batch_start + batch_size]
-
-            # Process batch with spaCy
-            for doc_idx, doc in enumerate(_nlp.pipe(batch, disable=['ner'])):
-                actual_idx = batch_start + doc_idx
-
-                # Extract noun chunks
-                for chunk in doc.noun_chunks:
-                    # Normalize the phrase
-                    normalized = self._normalize_phrase(chunk.text)
-
-                    if not normalized:
-                        continue
-
-                    # Skip if matches skip patterns
-                    if any(p.match(normalized) for p in self._skip_patterns):
-                        continue
-
-                    # Skip if too short or too long
-                    word_count = len(normalized.split())
-                    if len(normalized) < self.min_length or word_count > self.max_words:
-                        continue
-
-                    # Count occurrences
-                    phrase_counts[normalized] += 1
-
-                    # Track document frequency
-                    if normalized not in phrase_docs:
-                        phrase_docs[normalized] = set()
-                    phrase_docs[normalized].add(actual_idx)
-
-                    # Store root word
-                    if normalized not in phrase_roots:
-                        phrase_roots[normalized] = chunk.root.text.lower()
+        # Stream the whole corpus through one pipe call; spaCy handles the
+        # batching internally and n_process > 1 parallelizes the CPU-bound
+        # parse across cores (unused components are excluded at load time)
+        docs = _nlp.pipe(
+            corpus, batch_size=self.batch_size, n_process=self.n_process
+        )
+        for doc in docs:
+            # One transient set per document replaces a persistent set of
+            # doc indexes per phrase: doc_freq only needs first sightings
+            seen_in_doc: Set[str] = set()
+
+            # Extract noun chunks
+            for chunk in doc.noun_chunks:
+                # Raw text was never regex-cleaned, so drop chunks that
+                # contain URL- or email-like tokens here
+                if self.raw_mode and any(
+                    t.like_url or t.like_email for t in chunk
+                ):
+                    continue
+
+                # Normalize the phrase
+                normalized = self._normalize_phrase(chunk.text)
+
+                if not normalized:
+                    continue
+
+                # Skip pattern/length/word-count rejects in one call
+                if not self._accept(normalized):
+                    continue
+
+                # Count occurrences
+                phrase_counts[normalized] += 1
+
+                # Track document frequency
+                if normalized not in seen_in_doc:
+                    seen_in_doc.add(normalized)
+                    phrase_doc_freq[normalized] += 1
+
+                # Store root word
+                if normalized not in phrase_roots:
+                    phrase_roots[normalized] = chunk.root.text.lower()
 
         # Convert to NounPhrase objects
         phrases = []
         for phrase_text, count in phrase_counts.items():
-            doc_freq = len(phrase_docs.get(phrase_text, set()))
+            doc_freq = phrase_doc_freq[phrase_text]
 
             if doc_freq >= self.min_df:
                 phrases.append(NounPhrase(
@@ -185,9 +303,7 @@ class SpacyExtractor:
                 ))
 
         # Sort by document frequency, then by total occurrences
-        phrases.sort(key=lambda p: (p.doc_freq, p.total_occurrences), reverse=True)
-
-        result = phrases[:self.top_n]
+        result = _top_by_frequency(phrases, self.top_n)
         logger.info("spaCy extracted %d noun phrases", len(result))
 
         return result
@@ -207,64 +323,117 @@ class SpacyExtractor:
         normalized = phrase.lower().strip()
 
         # Remove punctuation from edges
-        normalized = re.sub(r'^[^\w]+|[^\w]+$', '', normalized)
+        normalized = self._edge_punct_re.sub('', normalized)
 
-        # Collapse whitespace
-        normalized = re.sub(r'\s+', ' ', normalized)
+        # No separate whitespace collapse: the split() below already
+        # handles runs of any whitespace
 
-        # Strip edge stopwords
+        # Strip edge stopwords by moving index bounds and slicing once,
+        # instead of repeated O(n) list.pop(0) calls
         words = normalized.split()
-        while words and words[0] in self.edge_stopwords:
-            words.pop(0)
-        while words and words[-1] in self.edge_stopwords:
-            words.pop()
-
-        if not words:
+        stopwords = self._edge_stop_fs
+        start, end = 0, len(words)
+        while start < end and words[start] in stopwords:
+            start += 1
+        while end > start and words[end - 1] in stopwords:
+            end -= 1
+
+        if start == end:
             return None
 
-        return ' '.join(words)
+        if start or end != len(words):
+            words = words[start:end]
+
+        # Interning collapses the phrase strings recurring across documents
+        # to one object, making the counter lookups pointer-equality hits
+        return sys.intern(' '.join(words))
 
     def _fallback_extract(self, corpus: List[str]) -> List[NounPhrase]:
         """
         Fallback noun phrase extraction without spaCy.
 
-        Uses simple heuristics to identify potential noun phrases.
+        Prefers a vectorized CountVectorizer path (tokenization and
+        counting happen in Cython, both frequency columns come from one
+        sparse matrix); falls back to pure-Python heuristics only when
+        scikit-learn is unavailable too.
         """
         logger.info("Using fallback noun phrase extraction")
 
-        # Common adjective patterns that often precede nouns
-        adjective_patterns = {
-            'digital', 'automatic', 'electric', 'electronic', 'wireless',
-            'compact', 'portable', 'adjustable', 'removable', 'built-in',
-            'stainless', 'steel', 'glass', 'plastic', 'metal', 'aluminum',
-            'led', 'lcd', 'touch', 'smart', 'high', 'low', 'fast', 'slow',
-            'large', 'small', 'medium', 'mini', 'micro', 'dual', 'triple',
-            'multi', 'single', 'double', 'full', 'half', 'auto', 'manual',
-            'front', 'back', 'side', 'top', 'bottom', 'inner', 'outer',
-            'easy', 'quick', 'safe', 'secure', 'quiet', 'silent', 'powerful',
-        }
-
-        # Common technical noun suffixes
-        noun_suffixes = {
-            'tion', 'sion', 'ment', 'ness', 'ity', 'ance', 'ence',
-            'er', 'or', 'ist', 'ism', 'ing', 'age', 'ure', 'ry',
-            'ty', 'al', 'ics', 'ogy', 'logy',
-        }
+        try:
+            from sklearn.feature_extraction.text import CountVectorizer
+        except ImportError:
+            return self._python_fallback_extract(corpus)
+
+        vectorizer = CountVectorizer(
+            ngram_range=(1, 2),
+            lowercase=True,
+            min_df=self.min_df,
+            token_pattern=r'(?u)\b\w{3,}\b',
+        )
+        try:
+            matrix = vectorizer.fit_transform(corpus)
+        except ValueError:
+            # Empty vocabulary (e.g. all docs below the token length floor)
+            return []
+
+        total = np.asarray(matrix.sum(axis=0)).ravel()
+        doc_freq = np.asarray((matrix > 0).sum(axis=0)).ravel()
+        vocab = np.asarray(vectorizer.get_feature_names_out(), dtype=str)
+
+        # Apply the noun heuristics as numpy boolean masks over the (already
+        # min_df-filtered) vocabulary: bigrams qualify when the first word is
+        # a known adjective or the last word has a noun suffix; unigrams need
+        # 4+ characters and a noun suffix
+        parts = np.char.partition(vocab, ' ')
+        is_bigram = parts[:, 1] == ' '
+        ends_with_suffix = np.zeros(len(vocab), dtype=bool)
+        for suffix in _FALLBACK_NOUN_SUFFIXES:
+            ends_with_suffix |= np.char.endswith(vocab, suffix)
+        adjective_first = np.isin(parts[:, 0], _FALLBACK_ADJECTIVE_ARRAY)
+        mask = np.where(
+            is_bigram,
+            adjective_first | ends_with_suffix,
+            (np.char.str_len(vocab) >= 4) & ends_with_suffix,
+        )
+
+        phrases = [
+            NounPhrase(
+                phrase=str(vocab[i]),
+                doc_freq=int(doc_freq[i]),
+                total_occurrences=int(total[i]),
+                root_word=str(parts[i, 2]) if parts[i, 1] else str(vocab[i]),
+            )
+            for i in np.flatnonzero(mask)
+        ]
+
+        return _top_by_frequency(phrases, self.top_n)
+
+    def _python_fallback_extract(self, corpus: List[str]) -> List[NounPhrase]:
+        """
+        Pure-Python noun phrase heuristics (last-resort fallback).
+
+        Uses simple heuristics to identify potential noun phrases.
+        """
+        adjective_patterns = _FALLBACK_ADJECTIVES
+        # str.endswith checks a whole tuple of suffixes in one C call,
+        # instead of 20 interpreter dispatches through any()
+        noun_suffixes = _FALLBACK_NOUN_SUFFIXES
 
         phrase_counts: Counter = Counter()
-        phrase_docs: Dict[str, Set[int]] = {}
+        phrase_doc_freq: Counter = Counter()
 
-        for doc_idx, doc in enumerate(corpus):
+        for doc in corpus:
             words = doc.lower().split()
+            seen_in_doc: Set[str] = set()
 
             # Extract potential noun phrases (adj + noun, noun + noun combinations)
             for i, word in enumerate(words):
                 # Single important words
-                if len(word) >= 4 and any(word.endswith(s) for s in noun_suffixes):
+                if len(word) >= 4 and word.endswith(noun_suffixes):
                     phrase_counts[word] += 1
-                    if word not in phrase_docs:
-                        phrase_docs[word] = set()
-                    phrase_docs[word].add(doc_idx)
+                    if word not in seen_in_doc:
+                        seen_in_doc.add(word)
+                        phrase_doc_freq[word] += 1
 
                 # Two-word phrases
                 if i < len(words) - 1:
@@ -272,28 +441,28 @@ class SpacyExtractor:
 
                     # adjective + noun pattern
                     if (word in adjective_patterns or
-                            any(next_word.endswith(s) for s in noun_suffixes)):
-                        phrase = f"{word} {next_word}"
+                            next_word.endswith(noun_suffixes)):
+                        phrase = sys.intern(f"{word} {next_word}")
                         if len(phrase) >= self.min_length:
                             phrase_counts[phrase] += 1
-                            if phrase not in phrase_docs:
-                                phrase_docs[phrase] = set()
-                            phrase_docs[phrase].add(doc_idx)
+                            if phrase not in seen_in_doc:
+                                seen_in_doc.add(phrase)
+                                phrase_doc_freq[phrase] += 1
 
                     # noun + noun pattern
-                    if (any(word.endswith(s) for s in noun_suffixes) and
-                            any(next_word.endswith(s) for s in noun_suffixes)):
-                        phrase = f"{word} {next_word}"
+                    if (word.endswith(noun_suffixes) and
+                            next_word.endswith(noun_suffixes)):
+                        phrase = sys.intern(f"{word} {next_word}")
                         if len(phrase) >= self.min_length:
                             phrase_counts[phrase] += 1
-                            if phrase not in phrase_docs:
-                                phrase_docs[phrase] = set()
-                            phrase_docs[phrase].add(doc_idx)
+                            if phrase not in seen_in_doc:
+                                seen_in_doc.add(phrase)
+                                phrase_doc_freq[phrase] += 1
 
         # Convert to NounPhrase objects
         phrases = []
         for phrase_text, count in phrase_counts.items():
-            doc_freq = len(phrase_docs.get(phrase_text, set()))
+            doc_freq = phrase_doc_freq[phrase_text]
 
             if doc_freq >= self.min_df:
                 phrases.append(NounPhrase(
@@ -304,9 +473,7 @@ class SpacyExtractor:
                 ))
 
         # Sort and return
-        phrases.sort(key=lambda p: (p.doc_freq, p.total_occurrences), reverse=True)
-
-        return phrases[:self.top_n]
+        return _top_by_frequency(phrases, self.top_n)
 
 
-__all__ = ['SpacyExtractor', 'NounPhrase']
+__all__ = ['SpacyExtractor', 'NounPhrase', 'warmup']
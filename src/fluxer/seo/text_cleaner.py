@@ -6,7 +6,11 @@ while preserving technical terms and specifications.
 """
 from __future__ import annotations
 
+import os
 import re
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Set, Optional
 from dataclasses import dataclass, field
 
@@ -14,6 +18,56 @@ from ..logger import get_logger
 
 logger = get_logger(__name__)
 
+# Optional linear-time regex engine: the master pattern is a long literal
+# alternation, which RE2 compiles to a DFA instead of a backtracking NFA.
+# Falls back to the stdlib engine when google-re2/pyre2 is not installed.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Optional Aho-Corasick matcher for the literal marketing/brand phrases:
+# one automaton pass is O(text + total pattern length) however long the
+# brand list grows, where a regex alternation degrades with pattern count.
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+# Optional Arrow backing for large corpora: a large_string array keeps all
+# documents in one contiguous buffer with offsets instead of one ~50B
+# Python str object per document.
+try:
+    import pyarrow as _pa
+except ImportError:
+    _pa = None
+
+
+class _ArrowCorpus(Sequence):
+    """List-like view over an Arrow string array of cleaned documents.
+
+    Supports len/iteration/indexing like the plain list it replaces;
+    Python strings are materialized transiently on access rather than all
+    held alive at once.
+    """
+
+    __slots__ = ('_array',)
+
+    def __init__(self, documents: List[str]) -> None:
+        self._array = _pa.array(documents, type=_pa.large_string())
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [value.as_py() for value in self._array[index]]
+        return self._array[index].as_py()
+
+    def __iter__(self):
+        for value in self._array:
+            yield value.as_py()
+
 
 @dataclass
 class TextCleaner:
@@ -91,37 +145,120 @@ class TextCleaner:
     # Custom brand names to remove (configurable)
     brand_names: Set[str] = field(default_factory=set)
 
+    # Corpus size above which build_corpus cleans in worker processes
+    parallel_threshold: int = 500
+
     def __post_init__(self) -> None:
         """Initialize compiled patterns."""
-        # Compile marketing phrases pattern (case-insensitive, word boundary)
-        escaped_phrases = [re.escape(phrase) for phrase in self.MARKETING_PHRASES]
-        self._marketing_pattern = re.compile(
-            r'\b(' + '|'.join(escaped_phrases) + r')\b',
-            re.IGNORECASE
+        self._compile_master_pattern()
+
+        # Single-character filtering data: a standalone character survives
+        # only if it is a preserved unit, checked in one C-level regex scan
+        self._preserved_singles = frozenset(
+            u for u in self.PRESERVED_UNITS if len(u) == 1
         )
+        self._single_char_re = re.compile(r'(?<!\S)\S(?!\S)')
 
-        # Compile URL pattern
-        self._url_pattern = re.compile(self.URL_PATTERN, re.IGNORECASE)
-        self._email_pattern = re.compile(self.EMAIL_PATTERN, re.IGNORECASE)
+        # Memoize cleaning per input text: catalogs repeat boilerplate
+        # blocks across SKU variants, and a cache hit replaces the regex
+        # cascade with one dict lookup. Invalidated when brands change.
+        self._clean_cached = lru_cache(maxsize=16384)(self._clean_impl)
 
-        # Brand names pattern (compiled when brands are set)
-        self._brand_pattern: Optional[re.Pattern] = None
-        if self.brand_names:
-            self._compile_brand_pattern()
+    def _compile_master_pattern(self) -> None:
+        """Compile all removal patterns into one alternation.
 
-    def _compile_brand_pattern(self) -> None:
-        """Compile brand names pattern for removal."""
-        if self.brand_names:
-            escaped_brands = [re.escape(brand) for brand in self.brand_names]
-            self._brand_pattern = re.compile(
-                r'\b(' + '|'.join(escaped_brands) + r')\b',
-                re.IGNORECASE
-            )
+        A single fused pattern scans the document once and allocates one
+        result string, instead of six sequential sub() passes each walking
+        the full text. Group order mirrors the old pass order so earlier
+        rules win at a given position.
+        """
+        # Literal phrases (marketing + brands) go through an Aho-Corasick
+        # automaton when pyahocorasick is installed; otherwise they join
+        # the regex alternation below
+        self._phrase_automaton = None
+        if _ahocorasick is not None:
+            automaton = _ahocorasick.Automaton()
+            for phrase in self.MARKETING_PHRASES:
+                automaton.add_word(phrase.lower(), len(phrase))
+            for brand in self.brand_names:
+                automaton.add_word(brand.lower(), len(brand))
+            automaton.make_automaton()
+            self._phrase_automaton = automaton
+
+        parts = [
+            r'(?P<url>' + self.URL_PATTERN + r')',
+            r'(?P<email>' + self.EMAIL_PATTERN + r')',
+        ]
+        if self._phrase_automaton is None:
+            escaped_phrases = '|'.join(re.escape(p) for p in self.MARKETING_PHRASES)
+            parts.append(r'\b(?P<mkt>' + escaped_phrases + r')\b')
+            if self.brand_names:
+                escaped_brands = '|'.join(re.escape(b) for b in self.brand_names)
+                parts.append(r'\b(?P<brand>' + escaped_brands + r')\b')
+        parts.extend([
+            r'(?P<ent>&[a-z]+;|&#\d+;)',
+            r'(?P<dash>[–—])',
+            r'(?P<junk>[^\w\s.,\-°%]+)',
+        ])
+        pattern = '|'.join(parts)
+        if _re2 is not None:
+            try:
+                self._master_pattern = _re2.compile(pattern, re.IGNORECASE)
+                return
+            except Exception:
+                # RE2 rejects some constructs the stdlib accepts; fall back
+                logger.debug("RE2 could not compile master pattern, using re")
+        self._master_pattern = re.compile(pattern, re.IGNORECASE)
+
+    @staticmethod
+    def _master_replace(match: re.Match) -> str:
+        """Replacement callback: dashes normalize, everything else blanks."""
+        return '-' if match.lastgroup == 'dash' else ' '
+
+    def _remove_phrases_automaton(self, text: str) -> str:
+        """Splice out marketing/brand phrase matches in one automaton pass.
+
+        Matches are validated against word boundaries (the automaton is
+        boundary-blind), merged where they overlap, and removed in a single
+        rebuild of the string.
+        """
+        spans = []
+        text_len = len(text)
+        for end, length in self._phrase_automaton.iter(text):
+            start = end - length + 1
+            if start > 0 and (text[start - 1].isalnum() or text[start - 1] == '_'):
+                continue
+            stop = end + 1
+            if stop < text_len and (text[stop].isalnum() or text[stop] == '_'):
+                continue
+            spans.append((start, stop))
+
+        if not spans:
+            return text
+
+        spans.sort()
+        pieces = []
+        previous = 0
+        current_start, current_stop = spans[0]
+        for start, stop in spans[1:]:
+            if start <= current_stop:
+                current_stop = max(current_stop, stop)
+            else:
+                pieces.append(text[previous:current_start])
+                pieces.append(' ')
+                previous = current_stop
+                current_start, current_stop = start, stop
+        pieces.append(text[previous:current_start])
+        pieces.append(' ')
+        pieces.append(text[current_stop:])
+        return ''.join(pieces)
 
     def set_brand_names(self, brands: Set[str]) -> None:
         """Set brand names to remove from text."""
         self.brand_names = brands
-        self._compile_brand_pattern()
+        self._compile_master_pattern()
+        # Cached results were produced with the old brand pattern
+        self._clean_cached.cache_clear()
 
     def clean(self, text: str) -> str:
         """
@@ -135,46 +272,28 @@ class TextCleaner:
         """
         if not text:
             return ""
+        return self._clean_cached(text)
 
-        # Lowercase
+    def _clean_impl(self, text: str) -> str:
+        """Run the full cleaning pipeline (memoized via _clean_cached)."""
+        # One fused pass removes URLs, emails, marketing phrases, brands,
+        # HTML entities and stray punctuation, and normalizes dashes
+        # (literal phrases go through the automaton when available)
         text = text.lower()
+        if self._phrase_automaton is not None:
+            text = self._remove_phrases_automaton(text)
+        text = self._master_pattern.sub(self._master_replace, text)
+
+        # Remove standalone single characters (except units) in one regex
+        # scan instead of a split/filter/join loop over every word
+        preserved = self._preserved_singles
+        text = self._single_char_re.sub(
+            lambda m: m.group() if m.group() in preserved else ' ', text
+        )
 
-        # Remove URLs
-        text = self._url_pattern.sub(' ', text)
-
-        # Remove emails
-        text = self._email_pattern.sub(' ', text)
-
-        # Remove marketing phrases
-        text = self._marketing_pattern.sub(' ', text)
-
-        # Remove brand names if configured
-        if self._brand_pattern:
-            text = self._brand_pattern.sub(' ', text)
-
-        # Remove HTML entities
-        text = re.sub(r'&[a-z]+;|&#\d+;', ' ', text)
-
-        # Normalize dashes and special chars (but keep hyphens in compound words)
-        text = re.sub(r'[–—]', '-', text)
-
-        # Remove excessive punctuation (keep . , - for compound terms)
-        text = re.sub(r'[^\w\s.,\-°%]', ' ', text)
-
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-
-        # Remove standalone single characters (except units)
-        words = text.split()
-        cleaned_words = []
-        for word in words:
-            # Keep if length > 1 or if it's a recognized unit
-            if len(word) > 1 or word.lower() in self.PRESERVED_UNITS:
-                cleaned_words.append(word)
-
-        text = ' '.join(cleaned_words)
-
-        return text.strip()
+        # Normalize whitespace; split/join collapses runs and trims the
+        # edges in two C-level calls without regex machinery
+        return ' '.join(text.split())
 
     def extract_product_text(self, product: dict) -> str:
         """
@@ -225,12 +344,26 @@ class TextCleaner:
         Returns:
             List of cleaned document strings (one per product)
         """
-        corpus = []
-
-        for i, product in enumerate(products):
-            raw_text = self.extract_product_text(product)
-            cleaned_text = self.clean(raw_text)
+        texts = [self.extract_product_text(p) for p in products]
+
+        if len(texts) > self.parallel_threshold:
+            # Cleaning is CPU-bound and independent per document; fan it
+            # out across processes. Each worker compiles its own pattern
+            # set once via the initializer instead of pickling this
+            # instance's compiled patterns per task.
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(texts) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker_cleaner,
+                initargs=(self.MARKETING_PHRASES, self.brand_names),
+            ) as pool:
+                cleaned_iter = list(pool.map(_clean_text, texts, chunksize=chunksize))
+        else:
+            cleaned_iter = [self.clean(text) for text in texts]
 
+        corpus = []
+        for i, cleaned_text in enumerate(cleaned_iter):
             if cleaned_text:
                 corpus.append(cleaned_text)
             else:
@@ -239,7 +372,32 @@ class TextCleaner:
         logger.info("Built corpus with %d documents from %d products",
                    len(corpus), len(products))
 
+        # Hand back an Arrow-backed sequence when pyarrow is installed;
+        # downstream extractors only need len/iteration/indexing
+        if _pa is not None and corpus:
+            return _ArrowCorpus(corpus)
+
         return corpus
 
 
+# Per-process cleaner for build_corpus's process pool; created once per
+# worker by the initializer so compiled patterns never cross process
+# boundaries.
+_worker_cleaner: Optional[TextCleaner] = None
+
+
+def _init_worker_cleaner(marketing_phrases: List[str], brand_names: Set[str]) -> None:
+    """Build this worker's TextCleaner from the parent's configuration."""
+    global _worker_cleaner
+    _worker_cleaner = TextCleaner(
+        MARKETING_PHRASES=list(marketing_phrases),
+        brand_names=set(brand_names),
+    )
+
+
+def _clean_text(text: str) -> str:
+    """Clean one document with the per-worker cleaner (picklable task)."""
+    return _worker_cleaner.clean(text)
+
+
 __all__ = ['TextCleaner']
@@ -6,12 +6,95 @@ with configurable n-gram ranges and frequency thresholds.
 """
 from __future__ import annotations
 
+import os
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import List, Dict, FrozenSet, Iterable, Tuple, Optional
 import numpy as np
 
 from ..logger import get_logger
 
+# Optional: pyahocorasick turns per-feature substring counting into a
+# single linear sweep per document
+try:
+    import ahocorasick as _ahocorasick
+except ImportError:
+    _ahocorasick = None
+
+# joblib ships with scikit-learn; guarded anyway so the fallback path
+# keeps working when sklearn itself is absent
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+    delayed = None
+
+# Token pattern shared by the single-threaded vectorizer and the chunked
+# parallel pipeline so both tokenize identically
+_TOKEN_PATTERN = r'(?u)\b[a-zA-Z][a-zA-Z0-9\-]*[a-zA-Z0-9]\b|\b[a-zA-Z]\b'
+
+# Optional: google-re2 scans with a DFA instead of re's backtracking
+# engine, which is noticeably faster for tokenizing long documents.
+# Guarded compile — RE2 rejects some constructs the stdlib accepts.
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Default extra stopwords, shared by all instances — one frozen set at
+# module load instead of a fresh list per TFIDFExtractor()
+_DEFAULT_EXTRA_STOPWORDS: FrozenSet[str] = frozenset((
+    'product', 'products', 'item', 'items', 'feature', 'features',
+    'includes', 'including', 'included', 'include',
+    'provides', 'providing', 'provided', 'provide',
+    'offers', 'offering', 'offered', 'offer',
+    'available', 'availability',
+    'new', 'latest', 'model', 'version', 'series',
+    'use', 'uses', 'using', 'used',
+    'make', 'makes', 'making', 'made',
+    'help', 'helps', 'helping', 'helped',
+    'allow', 'allows', 'allowing', 'allowed',
+    'enable', 'enables', 'enabling', 'enabled',
+    'ensure', 'ensures', 'ensuring', 'ensured',
+    'also', 'just', 'even', 'really', 'very', 'well',
+    'like', 'way', 'thing', 'things', 'lot', 'lots',
+    'need', 'needs', 'want', 'wants',
+    'come', 'comes', 'coming', 'came',
+    'get', 'gets', 'getting', 'got',
+    'see', 'look', 'looks', 'looking',
+    'know', 'knows', 'knowing', 'known',
+))
+
+_RE2_TOKEN_RE = None
+if _re2 is not None:
+    try:
+        _RE2_TOKEN_RE = _re2.compile(
+            r'\b[a-zA-Z][a-zA-Z0-9\-]*[a-zA-Z0-9]\b|\b[a-zA-Z]\b'
+        )
+    except Exception:
+        _RE2_TOKEN_RE = None
+
+
+def _re2_tokenize(text: str) -> List[str]:
+    """Tokenize with the RE2 pattern; lowercases since the vectorizer
+    is configured with lowercase=False on this path."""
+    return _RE2_TOKEN_RE.findall(text.lower())
+
+
+def _tokenizer_kwargs() -> Dict[str, object]:
+    """Vectorizer tokenization arguments, shared by every construction
+    site so the fit, transform, and parallel-chunk paths stay identical.
+    Uses the RE2 tokenizer when available, else the stdlib pattern."""
+    if _RE2_TOKEN_RE is not None:
+        return {
+            'tokenizer': _re2_tokenize,
+            'lowercase': False,
+            'token_pattern': None,
+        }
+    return {'lowercase': True, 'token_pattern': _TOKEN_PATTERN}
+
 logger = get_logger(__name__)
 
 # Lazy import sklearn to handle missing dependency gracefully
@@ -38,7 +121,35 @@ def _check_sklearn() -> bool:
     return _sklearn_available
 
 
-@dataclass
+@lru_cache(maxsize=16)
+def _make_vectorizer(
+    ngram_range: Tuple[int, int],
+    min_df: int,
+    max_df: float,
+    max_features: int,
+    stop_words: FrozenSet[str],
+):
+    """Memoized unfitted TfidfVectorizer template for a configuration.
+
+    Services that process many small catalogs construct extractors per
+    request; memoizing the template skips repeated parameter setup.
+    Callers must clone the result so concurrent fits never share state.
+    Only called after _check_sklearn() has populated TfidfVectorizer.
+    """
+    return TfidfVectorizer(
+        ngram_range=ngram_range,
+        stop_words=list(stop_words),
+        min_df=min_df,
+        max_df=max_df,
+        max_features=max_features,
+        # float32 halves the matrix footprint; downstream use is only
+        # sums, which accumulate in float64 anyway
+        dtype=np.float32,
+        **_tokenizer_kwargs()
+    )
+
+
+@dataclass(slots=True)
 class TFIDFPhrase:
     """A phrase extracted via TF-IDF analysis."""
     phrase: str
@@ -71,35 +182,28 @@ class TFIDFExtractor:
     # Top N phrases to return (200 is practical for SEO)
     top_n: int = 200
 
+    # Worker processes for vectorization. 1 keeps the single-threaded
+    # sklearn path; >1 (or -1 for all cores) enables the chunked two-pass
+    # parallel pipeline, worthwhile for large catalogs
+    n_jobs: int = 1
+
     # Additional stopwords beyond English defaults
-    extra_stopwords: List[str] = field(default_factory=lambda: [
-        'product', 'products', 'item', 'items', 'feature', 'features',
-        'includes', 'including', 'included', 'include',
-        'provides', 'providing', 'provided', 'provide',
-        'offers', 'offering', 'offered', 'offer',
-        'available', 'availability',
-        'new', 'latest', 'model', 'version', 'series',
-        'use', 'uses', 'using', 'used',
-        'make', 'makes', 'making', 'made',
-        'help', 'helps', 'helping', 'helped',
-        'allow', 'allows', 'allowing', 'allowed',
-        'enable', 'enables', 'enabling', 'enabled',
-        'ensure', 'ensures', 'ensuring', 'ensured',
-        'provide', 'provides', 'providing', 'provided',
-        'also', 'just', 'even', 'really', 'very', 'well',
-        'like', 'way', 'thing', 'things', 'lot', 'lots',
-        'need', 'needs', 'want', 'wants',
-        'come', 'comes', 'coming', 'came',
-        'get', 'gets', 'getting', 'got',
-        'see', 'look', 'looks', 'looking',
-        'know', 'knows', 'knowing', 'known',
-    ])
+    extra_stopwords: FrozenSet[str] = field(
+        default_factory=lambda: _DEFAULT_EXTRA_STOPWORDS
+    )
 
     def __post_init__(self) -> None:
         """Initialize the vectorizer."""
         self._vectorizer = None
         self._feature_names = None
         self._tfidf_matrix = None
+        # Cached fit state for extract_incremental: vocabulary dict and
+        # per-feature IDF weights as a 1-D ndarray
+        self._vocabulary = None
+        self._idf = None
+        # Merged English + extra stopword set, built lazily on first
+        # sklearn extraction (keeps sklearn's import lazy)
+        self._stopwords = None
 
     def extract(self, corpus: List[str]) -> List[TFIDFPhrase]:
         """
@@ -129,87 +233,437 @@ class TFIDFExtractor:
         """Perform TF-IDF extraction using scikit-learn."""
         logger.info("Starting TF-IDF extraction on %d documents", len(corpus))
 
-        # Build combined stopwords list
-        stopwords = list(self.extra_stopwords)
-
-        # Initialize vectorizer
-        self._vectorizer = TfidfVectorizer(
-            ngram_range=self.ngram_range,
-            stop_words='english',
-            min_df=self.min_df,
-            max_df=self.max_df,
-            max_features=self.max_features,
-            lowercase=True,
-            token_pattern=r'(?u)\b[a-zA-Z][a-zA-Z0-9\-]*[a-zA-Z0-9]\b|\b[a-zA-Z]\b'
-        )
+        # One merged stopword set handed straight to the vectorizer:
+        # stopword n-grams never get generated, so no second Python-side
+        # filter over the extracted phrases is needed
+        self._merged_stopwords()
 
-        # Fit and transform
-        self._tfidf_matrix = self._vectorizer.fit_transform(corpus)
-        self._feature_names = self._vectorizer.get_feature_names_out()
+        if self.n_jobs != 1 and Parallel is not None and len(corpus) > 1:
+            self._tfidf_matrix, self._feature_names = (
+                self._parallel_fit_transform(corpus)
+            )
+        else:
+            # Clone the memoized unfitted template so repeated extractions
+            # with the same configuration skip re-construction while each
+            # fit still gets its own instance
+            from sklearn.base import clone
+            self._vectorizer = clone(_make_vectorizer(
+                self.ngram_range,
+                self.min_df,
+                self.max_df,
+                self.max_features,
+                self._stopwords,
+            ))
+
+            # Fit and transform, caching the learned state for reuse
+            self._tfidf_matrix = self._vectorizer.fit_transform(corpus)
+            self._feature_names = self._vectorizer.get_feature_names_out()
+            self._vocabulary = self._vectorizer.vocabulary_
+            self._idf = np.asarray(self._vectorizer.idf_, dtype=np.float64)
 
         logger.info("TF-IDF extracted %d unique features", len(self._feature_names))
 
-        # Calculate aggregate scores
-        phrases = self._calculate_phrase_scores(corpus)
+        # Calculate aggregate scores; filtering and top-N selection
+        # happen inside before any phrase objects are built
+        return self._calculate_phrase_scores(corpus)
 
-        # Filter extra stopwords
-        stopwords_set = set(stopwords)
-        filtered_phrases = []
-        for phrase in phrases:
-            # Skip if phrase is just a stopword or contains only stopwords
-            words = phrase.phrase.split()
-            if all(w in stopwords_set for w in words):
-                continue
-            # Skip very short phrases
-            if len(phrase.phrase) < 3:
-                continue
-            filtered_phrases.append(phrase)
+    def extract_incremental(self, corpus: List[str]) -> List[TFIDFPhrase]:
+        """
+        Score a new corpus batch against the already-fitted vocabulary.
 
-        # Sort by combined score (doc_freq * tfidf_score) and return top N
-        filtered_phrases.sort(
-            key=lambda p: (p.doc_freq, p.tfidf_score),
-            reverse=True
-        )
+        Reuses the vocabulary and IDF weights learned by the last
+        extract() call, so only the transform runs — no vocabulary
+        refit. Useful when a catalog grows incrementally and refitting
+        per batch would dominate. Falls back to a full extract() when
+        nothing has been fitted yet.
 
-        result = filtered_phrases[:self.top_n]
-        logger.info("TF-IDF returning %d top phrases", len(result))
+        Args:
+            corpus: List of cleaned document strings
 
-        return result
+        Returns:
+            List of TFIDFPhrase objects sorted by importance
+        """
+        if not corpus:
+            logger.warning("Empty corpus provided to TF-IDF extractor")
+            return []
 
-    def _calculate_phrase_scores(self, corpus: List[str]) -> List[TFIDFPhrase]:
-        """Calculate aggregate TF-IDF scores and frequencies for each phrase."""
-        phrases = []
+        if self._vocabulary is None or self._idf is None:
+            return self.extract(corpus)
 
-        # Get the TF-IDF matrix as array
-        tfidf_array = self._tfidf_matrix.toarray()
+        if not _check_sklearn():
+            return self._fallback_extraction(corpus)
 
-        for idx, feature in enumerate(self._feature_names):
-            # Column for this feature
-            col = tfidf_array[:, idx]
+        try:
+            logger.info(
+                "Incremental TF-IDF on %d documents (%d cached features)",
+                len(corpus), len(self._feature_names)
+            )
+            self._tfidf_matrix = self._transform(corpus)
+            return self._calculate_phrase_scores(corpus)
+        except Exception as e:
+            logger.error("Incremental TF-IDF failed: %s", e, exc_info=True)
+            return self._fallback_extraction(corpus)
+
+    def extract_streaming(
+        self,
+        corpus: Iterable[str],
+        chunk_size: int = 5000
+    ) -> List[TFIDFPhrase]:
+        """
+        Extract phrases from a corpus too large to vectorize in one piece.
+
+        Two chunked passes, neither of which holds more than one chunk's
+        matrix in memory: pass 1 accumulates global document and term
+        frequencies chunk by chunk and prunes them to a vocabulary; pass
+        2 transforms each chunk against that vocabulary, applies IDF
+        weighting and L2 normalization in place, and folds the per-chunk
+        column aggregates into running totals. Memory stays
+        O(chunk + vocabulary) instead of O(corpus + matrix).
+
+        The corpus must be re-iterable (a list, or the Arrow-backed
+        corpus from TextCleaner); a one-shot generator would leave the
+        second pass empty.
+
+        Args:
+            corpus: Re-iterable of cleaned document strings
+            chunk_size: Documents vectorized per chunk
+
+        Returns:
+            List of TFIDFPhrase objects sorted by importance
+        """
+        if not _check_sklearn():
+            logger.error("scikit-learn not available, cannot perform TF-IDF extraction")
+            return self._fallback_extraction(list(corpus))
+
+        from sklearn.preprocessing import normalize
+
+        stop_words = self._merged_stopwords()
+
+        # Pass 1: global doc/term frequencies, one chunk at a time
+        doc_freq_counts: Counter = Counter()
+        term_freq_counts: Counter = Counter()
+        n_docs = 0
+        for chunk in _iter_chunks(corpus, chunk_size):
+            n_docs += len(chunk)
+            chunk_df, chunk_tf = _count_chunk(chunk, self.ngram_range, stop_words)
+            doc_freq_counts.update(chunk_df)
+            term_freq_counts.update(chunk_tf)
+
+        if not n_docs:
+            logger.warning("Empty corpus provided to TF-IDF extractor")
+            return []
+
+        logger.info(
+            "Streaming TF-IDF pass 1: %d documents, %d raw terms",
+            n_docs, len(doc_freq_counts)
+        )
 
-            # TF-IDF score = sum across all documents
-            tfidf_score = float(np.sum(col))
+        terms = self._prune_vocabulary(doc_freq_counts, term_freq_counts, n_docs)
+        if not terms:
+            logger.warning("No terms survived vocabulary pruning")
+            return []
+        vocabulary = {term: idx for idx, term in enumerate(terms)}
+
+        df_column = np.fromiter(
+            (doc_freq_counts[term] for term in terms),
+            dtype=np.int64, count=len(terms)
+        )
+        idf = np.log((1 + n_docs) / (1 + df_column)) + 1
 
-            # Document frequency = number of docs where this phrase appears
-            doc_freq = int(np.sum(col > 0))
+        # Cache fit state so extract_incremental works after streaming
+        self._vectorizer = None
+        self._vocabulary = vocabulary
+        self._idf = idf
+        self._feature_names = np.asarray(terms, dtype=object)
+        self._tfidf_matrix = None
 
-            # Total occurrences (approximate from inverse document frequency)
-            # We'll count actual occurrences for more accuracy
-            total_occurrences = sum(
-                doc.lower().count(feature.lower())
-                for doc in corpus
+        # Pass 2: per-chunk transform, weight, and aggregate
+        score_sums = np.zeros(len(terms))
+        totals = np.zeros(len(terms), dtype=np.int64)
+        for chunk in _iter_chunks(corpus, chunk_size):
+            tfidf = _transform_chunk(
+                chunk, vocabulary, self.ngram_range, stop_words
+            ).astype(np.float32)
+            tfidf.data *= idf[tfidf.indices]
+            normalize(tfidf, norm='l2', copy=False)
+            score_sums += self._csc_column_sums(tfidf.tocsc())
+            totals += self._count_occurrences(chunk)
+
+        return self._build_phrases(score_sums, df_column, totals)
+
+    def _transform(self, corpus: List[str]) -> object:
+        """Transform a corpus with the cached vocabulary and IDF weights."""
+        if self._vectorizer is not None:
+            return self._vectorizer.transform(corpus)
+
+        # Parallel-fitted state has no TfidfVectorizer instance; rebuild
+        # counts against the cached vocabulary and weight in place
+        from sklearn.preprocessing import normalize
+
+        tfidf = _transform_chunk(
+            corpus, self._vocabulary, self.ngram_range, self._stopwords
+        ).astype(np.float32)
+        tfidf.data *= self._idf[tfidf.indices]
+        normalize(tfidf, norm='l2', copy=False)
+        return tfidf
+
+    def _select_top(
+        self,
+        features: List,
+        scores: List[float],
+        doc_freqs: List[int],
+        totals: List[int],
+    ) -> List[TFIDFPhrase]:
+        """Build TFIDFPhrase objects for the top N candidate rows.
+
+        When more than top_n candidates survive filtering, argpartition
+        on a composite (doc_freq, tfidf_score) key narrows them in O(N)
+        before any objects exist; only the survivors are constructed and
+        fully sorted. Features may be strings or word tuples (the
+        fallback path defers joining until here).
+        """
+        count = len(features)
+        if count > self.top_n:
+            df_arr = np.fromiter(doc_freqs, dtype=np.float64, count=count)
+            score_arr = np.fromiter(scores, dtype=np.float64, count=count)
+            # doc_freq is the primary key, so scale it past the largest
+            # score; scores are non-negative on both extraction paths
+            composite = df_arr * (score_arr.max() + 1.0) + score_arr
+            top_idx = np.argpartition(-composite, self.top_n)[:self.top_n]
+            features = [features[i] for i in top_idx]
+            scores = [scores[i] for i in top_idx]
+            doc_freqs = [doc_freqs[i] for i in top_idx]
+            totals = [totals[i] for i in top_idx]
+
+        phrases = [
+            TFIDFPhrase(
+                phrase=feature if isinstance(feature, str) else ' '.join(feature),
+                tfidf_score=round(score, 4),
+                doc_freq=doc_freq,
+                total_occurrences=total,
             )
+            for feature, score, doc_freq, total
+            in zip(features, scores, doc_freqs, totals)
+        ]
+
+        # Full (doc_freq, tfidf_score) sort only over the survivors
+        phrases.sort(key=lambda p: (p.doc_freq, p.tfidf_score), reverse=True)
 
-            if doc_freq > 0:
-                phrases.append(TFIDFPhrase(
-                    phrase=feature,
-                    tfidf_score=round(tfidf_score, 4),
-                    doc_freq=doc_freq,
-                    total_occurrences=total_occurrences
-                ))
+        logger.info("TF-IDF returning %d top phrases", len(phrases))
 
         return phrases
 
+    def _merged_stopwords(self) -> FrozenSet[str]:
+        """Merged English + extra stopword set, built once per instance."""
+        if self._stopwords is None:
+            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+            self._stopwords = (
+                frozenset(ENGLISH_STOP_WORDS) | frozenset(self.extra_stopwords)
+            )
+        return self._stopwords
+
+    def _prune_vocabulary(
+        self,
+        doc_freqs: Counter,
+        term_freqs: Counter,
+        n_docs: int
+    ) -> List[str]:
+        """Apply the global min_df/max_df/max_features limits the
+        vectorizer would enforce, returning the surviving terms sorted."""
+        max_doc_count = (
+            self.max_df if isinstance(self.max_df, int)
+            else int(self.max_df * n_docs)
+        )
+        terms = [
+            term for term, df in doc_freqs.items()
+            if self.min_df <= df <= max_doc_count
+        ]
+        if self.max_features and len(terms) > self.max_features:
+            terms.sort(key=term_freqs.__getitem__, reverse=True)
+            terms = terms[:self.max_features]
+        terms.sort()
+        return terms
+
+    @staticmethod
+    def _csc_column_sums(csc) -> np.ndarray:
+        """Per-column sums of a CSC matrix in one reduceat pass,
+        accumulating in float64. Only non-empty columns are passed to
+        reduceat: their start offsets are strictly increasing and in
+        bounds, and each segment ends exactly where the next non-empty
+        column begins (empty columns own no data in between), so empty
+        columns — including trailing ones — simply keep their zero."""
+        counts = np.diff(csc.indptr)
+        sums = np.zeros(counts.size)
+        if csc.data.size:
+            nonempty = counts > 0
+            sums[nonempty] = np.add.reduceat(
+                csc.data, csc.indptr[:-1][nonempty], dtype=np.float64
+            )
+        return sums
+
+    def _parallel_fit_transform(
+        self,
+        corpus: List[str]
+    ) -> Tuple[object, np.ndarray]:
+        """Fit and transform the corpus with a chunked two-pass pipeline.
+
+        Pass 1 counts terms per corpus chunk in parallel workers and merges
+        the per-chunk document/term frequencies; the global min_df/max_df/
+        max_features limits are applied to the merged counts to fix the
+        vocabulary. Pass 2 transforms the chunks in parallel against that
+        shared vocabulary and vstacks the partial matrices, after which IDF
+        weighting is applied in-place on the sparse data (no matmul copy).
+
+        Matches TfidfVectorizer defaults: smooth IDF, no sublinear TF,
+        L2-normalized rows.
+        """
+        import scipy.sparse as sp
+        from sklearn.preprocessing import normalize
+
+        n_jobs = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        chunk_size = max(1, -(-len(corpus) // n_jobs))
+        chunks = [
+            corpus[i:i + chunk_size]
+            for i in range(0, len(corpus), chunk_size)
+        ]
+        logger.info(
+            "Parallel TF-IDF: %d documents in %d chunks across %d workers",
+            len(corpus), len(chunks), n_jobs
+        )
+
+        # Pass 1: per-chunk doc/term frequencies, merged into global counters
+        doc_freqs: Counter = Counter()
+        term_freqs: Counter = Counter()
+        results = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_count_chunk)(chunk, self.ngram_range, self._stopwords)
+            for chunk in chunks
+        )
+        for chunk_df, chunk_tf in results:
+            doc_freqs.update(chunk_df)
+            term_freqs.update(chunk_tf)
+
+        # Apply the global frequency limits the vectorizer would enforce
+        n_docs = len(corpus)
+        terms = self._prune_vocabulary(doc_freqs, term_freqs, n_docs)
+        vocabulary = {term: idx for idx, term in enumerate(terms)}
+
+        if not vocabulary:
+            raise ValueError("empty vocabulary after pruning")
+
+        # Pass 2: parallel transform against the shared vocabulary
+        partials = Parallel(n_jobs=n_jobs, backend='loky')(
+            delayed(_transform_chunk)(
+                chunk, vocabulary, self.ngram_range, self._stopwords
+            )
+            for chunk in chunks
+        )
+        counts = sp.vstack(partials, format='csr')
+
+        # In-place IDF weighting and row normalization
+        df_column = np.fromiter(
+            (doc_freqs[term] for term in terms),
+            dtype=np.float64, count=len(terms)
+        )
+        idf = np.log((1 + n_docs) / (1 + df_column)) + 1
+        tfidf = counts.astype(np.float32)
+        tfidf.data *= idf[tfidf.indices]
+        normalize(tfidf, norm='l2', copy=False)
+
+        # Cache fit state for extract_incremental; no vectorizer instance
+        # exists on this path, so _transform rebuilds from the vocabulary
+        self._vectorizer = None
+        self._vocabulary = vocabulary
+        self._idf = idf
+
+        return tfidf, np.asarray(terms, dtype=object)
+
+    def _calculate_phrase_scores(self, corpus: List[str]) -> List[TFIDFPhrase]:
+        """Calculate aggregate TF-IDF scores and frequencies for each phrase.
+
+        Filters stopword-only/short features and returns only the top N,
+        selected before any TFIDFPhrase objects are constructed.
+        """
+        # Work directly on the sparse CSC structure instead of densifying
+        # the whole (docs x features) matrix: column sums come from one
+        # reduceat over the stored values and document frequency is just
+        # the per-column entry count — memory stays O(nnz)
+        csc = self._tfidf_matrix.tocsc()
+        doc_freqs = np.diff(csc.indptr)
+        tfidf_scores = self._csc_column_sums(csc)
+
+        # The matrix itself is dead weight once the column aggregates
+        # exist; drop both references before the occurrence sweep so the
+        # peak footprint is one matrix, not matrix plus CSC copy
+        del csc
+        self._tfidf_matrix = None
+
+        totals = self._count_occurrences(corpus)
+
+        return self._build_phrases(tfidf_scores, doc_freqs, totals)
+
+    def _build_phrases(
+        self,
+        tfidf_scores: np.ndarray,
+        doc_freqs: np.ndarray,
+        totals: np.ndarray
+    ) -> List[TFIDFPhrase]:
+        """Filter the per-feature aggregate columns and select the top N.
+
+        tolist() converts each column to native Python values in one
+        call, so the loop does no per-index ndarray item access.
+        Surviving rows are kept as parallel lists; phrase objects are
+        only built for the final top N. No stopword filter is needed
+        here: the vectorizer gets the merged stopword set, so stopword
+        tokens never reach the vocabulary at all.
+        """
+        kept = ([], [], [], [])
+        rows = zip(
+            self._feature_names,
+            tfidf_scores.tolist(),
+            doc_freqs.tolist(),
+            totals.tolist(),
+        )
+        for feature, tfidf_score, doc_freq, total in rows:
+            if doc_freq == 0:
+                continue
+            # Skip very short phrases
+            if len(feature) < 3:
+                continue
+            kept[0].append(feature)
+            kept[1].append(tfidf_score)
+            kept[2].append(doc_freq)
+            kept[3].append(total)
+
+        return self._select_top(*kept)
+
+    def _count_occurrences(self, corpus: List[str]) -> np.ndarray:
+        """Count total substring occurrences of each feature in the corpus.
+
+        With pyahocorasick installed, all features are matched in one
+        automaton sweep per document — O(chars + matches) total instead of
+        O(features x chars) independent substring scans. Without it, falls
+        back to per-feature counting.
+        """
+        counts = np.zeros(len(self._feature_names), dtype=np.int64)
+
+        if _ahocorasick is not None:
+            automaton = _ahocorasick.Automaton()
+            for idx, feature in enumerate(self._feature_names):
+                automaton.add_word(feature.lower(), idx)
+            automaton.make_automaton()
+
+            for doc in corpus:
+                for _end, idx in automaton.iter(doc.lower()):
+                    counts[idx] += 1
+            return counts
+
+        # Case-fold each document once up front rather than once per feature
+        lc_corpus = [doc.lower() for doc in corpus]
+        for idx, feature in enumerate(self._feature_names):
+            needle = feature.lower()
+            counts[idx] = sum(doc.count(needle) for doc in lc_corpus)
+        return counts
+
     def _fallback_extraction(self, corpus: List[str]) -> List[TFIDFPhrase]:
         """
         Simple frequency-based extraction when sklearn is unavailable.
@@ -218,8 +672,6 @@ class TFIDFExtractor:
         """
         logger.info("Using fallback frequency extraction")
 
-        from collections import Counter
-
         # English stopwords (minimal set)
         stopwords = {
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
@@ -235,52 +687,167 @@ class TFIDFExtractor:
             'we', 'you', 'he', 'she', 'they', 'i', 'me', 'him', 'her', 'us', 'them',
         }
         stopwords.update(self.extra_stopwords)
-
-        # Count n-grams
-        ngram_counts: Counter = Counter()
-        doc_freqs: Dict[str, set] = {}
+        stopwords = frozenset(stopwords)
+
+        # Integer-encode the token stream so n-gram counting runs as
+        # vectorized array arithmetic instead of an interpreter loop over
+        # Counter updates. Each unique word gets an id (the only remaining
+        # Python-level pass); every n-gram becomes a packed base-(V+1)
+        # 64-bit key, and occurrence/document-frequency counts come from
+        # np.unique over the key arrays. Keys are decoded back to word
+        # tuples only for the min_df survivors.
+        word_ids: Dict[str, int] = {}
+        id_words: List[str] = []
+        id_is_stop: List[bool] = []
+        token_ids: List[int] = []
+        token_docs: List[int] = []
 
         for doc_idx, doc in enumerate(corpus):
-            words = doc.lower().split()
-
-            # Generate n-grams
-            for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
-                for i in range(len(words) - n + 1):
-                    ngram_words = words[i:i + n]
-
-                    # Skip if all words are stopwords
-                    if all(w in stopwords for w in ngram_words):
-                        continue
-
-                    ngram = ' '.join(ngram_words)
-
-                    ngram_counts[ngram] += 1
-
-                    if ngram not in doc_freqs:
-                        doc_freqs[ngram] = set()
-                    doc_freqs[ngram].add(doc_idx)
-
-        # Convert to phrases
-        phrases = []
-        for ngram, count in ngram_counts.items():
-            doc_freq = len(doc_freqs.get(ngram, set()))
-
-            if doc_freq >= self.min_df:
-                # Simple TF-IDF approximation
-                idf = np.log(len(corpus) / (doc_freq + 1)) + 1
-                tfidf_score = count * idf
+            for word in doc.lower().split():
+                wid = word_ids.get(word)
+                if wid is None:
+                    wid = len(id_words)
+                    word_ids[word] = wid
+                    id_words.append(word)
+                    id_is_stop.append(word in stopwords)
+                token_ids.append(wid)
+                token_docs.append(doc_idx)
+
+        n_tokens = len(token_ids)
+        if not n_tokens:
+            return []
 
-                phrases.append(TFIDFPhrase(
-                    phrase=ngram,
-                    tfidf_score=round(tfidf_score, 4),
-                    doc_freq=doc_freq,
-                    total_occurrences=count
-                ))
+        # Shift ids by one so keys of different n-gram lengths can never
+        # collide (a length-n key is always >= base^(n-1)). With the
+        # default trigram range this stays within int64 for vocabularies
+        # up to ~2M unique words, far beyond any fallback corpus here.
+        ids = np.fromiter(token_ids, dtype=np.int64, count=n_tokens) + 1
+        docs = np.fromiter(token_docs, dtype=np.int64, count=n_tokens)
+        is_stop = np.asarray(id_is_stop, dtype=bool)[ids - 1]
+        base = len(id_words) + 1
+
+        key_parts = []
+        doc_parts = []
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            if n_tokens < n:
+                break
+            span = n_tokens - n + 1
+            # Windows must not cross document boundaries
+            valid = docs[:span] == docs[n - 1:]
+            keys = ids[:span].copy()
+            all_stop = is_stop[:span].copy()
+            for offset in range(1, n):
+                keys *= base
+                keys += ids[offset:span + offset]
+                all_stop &= is_stop[offset:span + offset]
+            keep = valid & ~all_stop
+            key_parts.append(keys[keep])
+            doc_parts.append(docs[:span][keep])
+
+        all_keys = np.concatenate(key_parts)
+        if not all_keys.size:
+            return []
+        all_docs = np.concatenate(doc_parts)
+
+        # Total occurrences per n-gram, then document frequency via the
+        # count of unique (key, doc) pairs per key — both sorted by key,
+        # so the resulting arrays stay aligned
+        uniq_keys, counts = np.unique(all_keys, return_counts=True)
+        order = np.lexsort((all_docs, all_keys))
+        sorted_keys = all_keys[order]
+        sorted_docs = all_docs[order]
+        first_pair = np.empty(sorted_keys.size, dtype=bool)
+        first_pair[0] = True
+        first_pair[1:] = (
+            (sorted_keys[1:] != sorted_keys[:-1])
+            | (sorted_docs[1:] != sorted_docs[:-1])
+        )
+        dfs = np.unique(sorted_keys[first_pair], return_counts=True)[1]
+
+        keep_idx = np.flatnonzero(dfs >= self.min_df)
+        kept_counts = counts[keep_idx]
+        kept_dfs = dfs[keep_idx]
+        idfs = np.log(len(corpus) / (kept_dfs + 1)) + 1
+
+        # Decode survivors' packed keys back to word tuples
+        grams = []
+        for key in uniq_keys[keep_idx].tolist():
+            words = []
+            while key:
+                key, wid = divmod(key, base)
+                words.append(id_words[wid - 1])
+            words.reverse()
+            grams.append(tuple(words))
+
+        return self._select_top(
+            grams,
+            (kept_counts * idfs).tolist(),
+            kept_dfs.tolist(),
+            kept_counts.tolist(),
+        )
 
-        # Sort and return top N
-        phrases.sort(key=lambda p: (p.doc_freq, p.tfidf_score), reverse=True)
 
-        return phrases[:self.top_n]
+def _iter_chunks(corpus: Iterable[str], chunk_size: int):
+    """Yield successive chunk_size-document lists from a corpus."""
+    iterator = iter(corpus)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# Worker helpers for the parallel pipeline. Module-level so joblib's loky
+# backend can pickle them by reference.
+
+def _count_chunk(
+    chunk: List[str],
+    ngram_range: Tuple[int, int],
+    stop_words: frozenset
+) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Count document and term frequencies for one corpus chunk."""
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    vectorizer = CountVectorizer(
+        ngram_range=ngram_range,
+        stop_words=list(stop_words),
+        **_tokenizer_kwargs()
+    )
+    try:
+        counts = vectorizer.fit_transform(chunk)
+    except ValueError:
+        # Chunk produced an empty vocabulary (e.g. all stopwords)
+        return {}, {}
+
+    terms = vectorizer.get_feature_names_out()
+    chunk_df = np.diff(counts.tocsc().indptr)
+    chunk_tf = np.asarray(counts.sum(axis=0)).ravel()
+
+    return (
+        dict(zip(terms, chunk_df.tolist())),
+        dict(zip(terms, chunk_tf.tolist())),
+    )
+
+
+def _transform_chunk(
+    chunk: List[str],
+    vocabulary: Dict[str, int],
+    ngram_range: Tuple[int, int],
+    stop_words: frozenset
+):
+    """Transform one corpus chunk against the shared vocabulary."""
+    from sklearn.feature_extraction.text import CountVectorizer
+
+    # stop_words must match pass 1: n-grams are built over the
+    # stopword-filtered token stream, so dropping it here would leave
+    # stopword-spanning n-grams in the vocabulary unmatched
+    vectorizer = CountVectorizer(
+        ngram_range=ngram_range,
+        stop_words=list(stop_words),
+        vocabulary=vocabulary,
+        **_tokenizer_kwargs()
+    )
+    return vectorizer.transform(chunk)
 
 
 __all__ = ['TFIDFExtractor', 'TFIDFPhrase']
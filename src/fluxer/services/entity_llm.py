@@ -11,9 +11,11 @@ Only invoked when rules extraction has gaps or low confidence.
 """
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, FrozenSet, Optional, Any
 
 from ..models import EntityItem
 from ..config import Config
@@ -23,12 +25,15 @@ logger = get_logger(__name__)
 
 # Check OpenAI availability
 try:
-    from openai import OpenAI
+    from openai import OpenAI, AsyncOpenAI
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
     logger.warning("OpenAI package not installed. LLM extraction will be disabled.")
 
+# Fallback critical types when the caller does not supply its own set
+_DEFAULT_CRITICAL_TYPES: FrozenSet[str] = frozenset({'material', 'dimension'})
+
 
 # =============================================================================
 # JSON Schema for LLM output validation
@@ -270,6 +275,22 @@ Fix your output so that:
 Return JSON only."""
 
 
+MARSHALED_PROMPT_TEMPLATE = """TASK
+Extract entities for the following {record_count} products IN ONE PASS.
+Apply the same rules as single-product extraction to each record
+independently: infer the best primary_entity_path, fill only that record's
+missing entity types, include an evidence phrase copied from that record's
+inputs for every entity, and never invent facts or mix records.
+
+INPUT RECORDS (JSON array):
+{records_json}
+
+Return ONLY valid JSON of this exact shape:
+{{"results": [{{"product_id": "<id from input>", "primary_entity_path": "...", "llm_entities": [{{"name": "...", "type": "...", "evidence": "...", "value": null, "unit": null, "why_it_matters": null}}], "confidence": {{"primary_entity": 0.0, "supporting_entities": 0.0}}}}]}}
+
+Include EXACTLY one result per input record, matching each product_id."""
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -341,16 +362,19 @@ class EntityLLMExtractor:
         self.max_retries = max_retries
 
         self._client: Optional[Any] = None
+        self._async_client: Optional[Any] = None
         self._init_client()
 
     def _init_client(self) -> None:
-        """Initialize OpenAI client."""
+        """Initialize OpenAI clients (sync for batch/marshaled paths,
+        async for the concurrent fan-out path)."""
         if not OPENAI_AVAILABLE:
             return
 
         api_key = Config.OPENAI_API_KEY
         if api_key:
             self._client = OpenAI(api_key=api_key)
+            self._async_client = AsyncOpenAI(api_key=api_key)
             logger.info(f"LLM extractor initialized with model: {self.model}")
         else:
             logger.warning("OPENAI_API_KEY not set. LLM extraction will fail.")
@@ -364,7 +388,7 @@ class EntityLLMExtractor:
         rules_confidence: float,
         missing_types: List[str],
         threshold: float = 0.7,
-        critical_types: Optional[List[str]] = None
+        critical_types: Optional[FrozenSet[str]] = None
     ) -> tuple[bool, str]:
         """
         Determine if LLM should be invoked based on rules result.
@@ -373,7 +397,8 @@ class EntityLLMExtractor:
             rules_confidence: Confidence score from rules extraction
             missing_types: Entity types not found by rules
             threshold: Confidence threshold below which LLM is triggered
-            critical_types: Types that must be present
+            critical_types: Types that must be present (set-like for O(1)
+                membership checks)
 
         Returns:
             Tuple of (should_invoke, reason)
@@ -384,7 +409,7 @@ class EntityLLMExtractor:
         if not getattr(Config, 'ENTITY_LLM_ENABLED', True):
             return False, "LLM extraction disabled in config"
 
-        critical = critical_types or ['material', 'dimension']
+        critical = critical_types or _DEFAULT_CRITICAL_TYPES
 
         # Check if critical types are missing
         missing_critical = [t for t in missing_types if t in critical]
@@ -428,16 +453,9 @@ class EntityLLMExtractor:
         Returns:
             LLMExtractionResult with extracted entities
         """
-        result = LLMExtractionResult()
-
-        if not self.is_available():
-            result.success = False
-            result.error = "LLM not available"
-            return result
-
-        if not missing_types:
-            result.notes.append("No missing types to fill")
-            return result
+        early = self._early_exit_result(missing_types)
+        if early is not None:
+            return early
 
         try:
             # Build prompt with all context
@@ -454,28 +472,157 @@ class EntityLLMExtractor:
                 search_query=search_query
             )
 
-            # Call LLM with retry
-            response_data = self._call_with_retry(prompt)
+            # Call LLM with retry, then parse and validate
+            return self._finish_extraction(self._call_with_retry(prompt))
+
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}", exc_info=True)
+            return LLMExtractionResult(success=False, error=str(e))
 
-            if response_data is None:
-                result.success = False
-                result.error = "Failed to get valid response from LLM"
-                return result
+    async def aextract(
+        self,
+        product_name: str,
+        description: Optional[str],
+        tfidf_terms: List[Dict],
+        missing_types: List[str],
+        existing_entities: List[EntityItem],
+        rule_conflicts: Optional[List[str]] = None,
+        product_title: Optional[str] = None,
+        product_specs_text: Optional[str] = None,
+        grouped_terms: Optional[Dict[str, List[str]]] = None,
+        search_query: Optional[str] = None
+    ) -> LLMExtractionResult:
+        """
+        Async twin of extract() using the AsyncOpenAI client.
 
-            # Parse and validate response
-            result = self._parse_response(response_data)
-            result.notes.append(f"LLM extracted {len(result.llm_entities)} entities")
+        Same arguments and semantics; awaiting this from several tasks
+        lets a batch of products share the event loop instead of
+        serializing network round-trips. See extract_many().
+        """
+        early = self._early_exit_result(missing_types)
+        if early is not None:
+            return early
 
-            logger.info(
-                f"LLM extraction complete: {len(result.llm_entities)} entities, "
-                f"confidence={result.confidence:.2f}"
+        try:
+            prompt = self._build_prompt(
+                product_name=product_name,
+                product_title=product_title or product_name,
+                description=description,
+                specs_text=product_specs_text,
+                tfidf_terms=tfidf_terms,
+                grouped_terms=grouped_terms,
+                missing_types=missing_types,
+                existing_entities=existing_entities,
+                rule_conflicts=rule_conflicts or [],
+                search_query=search_query
             )
 
+            return self._finish_extraction(await self._acall_with_retry(prompt))
+
         except Exception as e:
             logger.error(f"LLM extraction failed: {e}", exc_info=True)
-            result.success = False
-            result.error = str(e)
+            return LLMExtractionResult(success=False, error=str(e))
+
+    def extract_many(
+        self,
+        requests: List[tuple[str, Dict]],
+        concurrency: Optional[int] = None
+    ) -> Dict[str, LLMExtractionResult]:
+        """
+        Extract many products concurrently over the async client.
+
+        Fans the calls out with asyncio.gather bounded by a semaphore, so
+        wall time for a batch approaches the slowest single call instead
+        of the sum of all calls. Results stay per-product — unlike
+        extract_marshaled there is no shared prompt, and unlike
+        extract_batch the responses come back in realtime.
 
+        Args:
+            requests: List of (custom_id, kwargs) pairs, where kwargs holds
+                the same keyword arguments accepted by extract()
+            concurrency: Maximum in-flight requests (default from
+                Config.ENTITY_LLM_CONCURRENCY, falling back to 8)
+
+        Returns:
+            Dict mapping custom_id to LLMExtractionResult
+        """
+        if not requests:
+            return {}
+
+        if not self.is_available():
+            return {
+                custom_id: LLMExtractionResult(success=False, error="LLM not available")
+                for custom_id, _ in requests
+            }
+
+        return asyncio.run(self._gather_extractions(requests, concurrency))
+
+    async def _gather_extractions(
+        self,
+        requests: List[tuple[str, Dict]],
+        concurrency: Optional[int]
+    ) -> Dict[str, LLMExtractionResult]:
+        """Run bounded-concurrency aextract() calls for a request batch."""
+        limit = concurrency or getattr(Config, 'ENTITY_LLM_CONCURRENCY', 8)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def bounded(kwargs: Dict) -> LLMExtractionResult:
+            async with semaphore:
+                return await self.aextract(**kwargs)
+
+        outcomes = await asyncio.gather(
+            *(bounded(kwargs) for _, kwargs in requests),
+            return_exceptions=True
+        )
+
+        results: Dict[str, LLMExtractionResult] = {}
+        for (custom_id, _), outcome in zip(requests, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"Concurrent extraction for '{custom_id}' failed: {outcome}")
+                results[custom_id] = LLMExtractionResult(
+                    success=False, error=str(outcome)
+                )
+            else:
+                results[custom_id] = outcome
+
+        succeeded = sum(1 for r in results.values() if r.success)
+        logger.info(
+            f"Concurrent extraction complete: {succeeded}/{len(requests)} succeeded"
+        )
+        return results
+
+    def _early_exit_result(
+        self,
+        missing_types: List[str]
+    ) -> Optional[LLMExtractionResult]:
+        """Shared precheck for extract()/aextract(); None means proceed."""
+        if not self.is_available():
+            return LLMExtractionResult(success=False, error="LLM not available")
+
+        if not missing_types:
+            result = LLMExtractionResult()
+            result.notes.append("No missing types to fill")
+            return result
+
+        return None
+
+    def _finish_extraction(
+        self,
+        response_data: Optional[Dict]
+    ) -> LLMExtractionResult:
+        """Shared response handling for extract()/aextract()."""
+        if response_data is None:
+            return LLMExtractionResult(
+                success=False, error="Failed to get valid response from LLM"
+            )
+
+        result = self._parse_response(response_data)
+        result.notes.append(f"LLM extracted {len(result.llm_entities)} entities")
+
+        logger.info(
+            f"LLM extraction complete: {len(result.llm_entities)} entities, "
+            f"confidence={result.confidence:.2f}"
+        )
         return result
 
     def _build_prompt(
@@ -560,32 +707,7 @@ class EntityLLMExtractor:
                 content = response.choices[0].message.content
                 last_content = content or ""
 
-                if not content:
-                    raise ValueError("Empty response from LLM")
-
-                # Parse JSON
-                data = json.loads(content)
-
-                # Validate basic structure
-                if not isinstance(data, dict):
-                    raise ValueError("Response is not a JSON object")
-
-                # Check for at least some useful keys (be lenient - extract what we can)
-                useful_keys = ["primary_entity_path", "llm_entities"]
-                has_useful = any(k in data for k in useful_keys)
-
-                if not has_useful:
-                    # If truly nothing useful, log what we got and retry
-                    logger.warning(f"Response missing useful keys. Got: {list(data.keys())}")
-                    raise ValueError(f"Response missing useful keys: {useful_keys}")
-
-                # Fill in defaults for missing optional keys
-                data.setdefault("primary_entity_path", "Unknown")
-                data.setdefault("llm_entities", [])
-                data.setdefault("placement_map", {})
-                data.setdefault("faqs", [])
-                data.setdefault("confidence", {"primary_entity": 0.5, "supporting_entities": 0.5})
-                data.setdefault("notes", {"missing_types": [], "conflicts": [], "assumptions": []})
+                data = self._coerce_response_data(content)
 
                 logger.info(f"LLM API call successful - extracted {len(data.get('llm_entities', []))} entities")
                 return data
@@ -627,6 +749,431 @@ class EntityLLMExtractor:
         logger.error(f"All LLM retry attempts failed: {last_error}")
         return None
 
+    async def _acall_with_retry(self, user_prompt: str) -> Optional[Dict]:
+        """Async twin of _call_with_retry() over the AsyncOpenAI client."""
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+
+        last_error = None
+        last_content = ""
+
+        for attempt in range(self.max_retries):
+            try:
+                logger.info(f"LLM API call attempt {attempt + 1}/{self.max_retries}")
+
+                response = await self._async_client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    response_format={"type": "json_object"},
+                    temperature=self.temperature,
+                    max_tokens=self.max_tokens
+                )
+
+                content = response.choices[0].message.content
+                last_content = content or ""
+
+                data = self._coerce_response_data(content)
+
+                logger.info(f"LLM API call successful - extracted {len(data.get('llm_entities', []))} entities")
+                return data
+
+            except (json.JSONDecodeError, ValueError) as e:
+                logger.warning(f"Response invalid (attempt {attempt + 1}): {e}")
+                last_error = e
+
+                # Add repair instruction for retry
+                if attempt < self.max_retries - 1:
+                    messages.append({
+                        "role": "assistant",
+                        "content": last_content
+                    })
+                    messages.append({
+                        "role": "user",
+                        "content": FIX_JSON_PROMPT
+                    })
+
+            except Exception as e:
+                logger.warning(f"LLM API call failed (attempt {attempt + 1}): {e}")
+                last_error = e
+
+        logger.error(f"All LLM retry attempts failed: {last_error}")
+        return None
+
+    def _coerce_response_data(self, content: Optional[str]) -> Dict:
+        """
+        Parse one JSON response payload and normalize its structure.
+
+        Shared by the realtime retry loop and the Batch API demultiplexer.
+
+        Raises:
+            json.JSONDecodeError: Malformed JSON
+            ValueError: Structurally unusable response
+        """
+        if not content:
+            raise ValueError("Empty response from LLM")
+
+        data = json.loads(content)
+
+        # Validate basic structure
+        if not isinstance(data, dict):
+            raise ValueError("Response is not a JSON object")
+
+        # Check for at least some useful keys (be lenient - extract what we can)
+        useful_keys = ["primary_entity_path", "llm_entities"]
+        has_useful = any(k in data for k in useful_keys)
+
+        if not has_useful:
+            # If truly nothing useful, log what we got and bail
+            logger.warning(f"Response missing useful keys. Got: {list(data.keys())}")
+            raise ValueError(f"Response missing useful keys: {useful_keys}")
+
+        # Fill in defaults for missing optional keys
+        data.setdefault("primary_entity_path", "Unknown")
+        data.setdefault("llm_entities", [])
+        data.setdefault("placement_map", {})
+        data.setdefault("faqs", [])
+        data.setdefault("confidence", {"primary_entity": 0.5, "supporting_entities": 0.5})
+        data.setdefault("notes", {"missing_types": [], "conflicts": [], "assumptions": []})
+
+        return data
+
+    def _build_batch_line(self, custom_id: str, user_prompt: str) -> Dict:
+        """Build one /v1/chat/completions request line for a Batch API file."""
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_prompt}
+                ],
+                "response_format": {"type": "json_object"},
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens
+            }
+        }
+
+    def submit_batch(
+        self,
+        requests: List[tuple[str, Dict]],
+        completion_window: str = "24h"
+    ) -> str:
+        """
+        Submit extractions to the OpenAI Batch API without waiting.
+
+        Serializes one /v1/chat/completions request per product to JSONL,
+        uploads it via the Files API and creates a Batch job. Returns
+        immediately so a nightly scheduler can persist the batch id and
+        collect results on a later run via collect_batch().
+
+        Args:
+            requests: List of (custom_id, kwargs) pairs, where kwargs holds
+                the same keyword arguments accepted by extract()
+            completion_window: Batch API completion window
+
+        Returns:
+            The Batch API job id
+
+        Raises:
+            RuntimeError: LLM client not available
+            ValueError: Empty request list
+            Exception: Propagated OpenAI API errors
+        """
+        if not requests:
+            raise ValueError("No requests to submit")
+
+        if not self.is_available():
+            raise RuntimeError("LLM not available")
+
+        lines = []
+        for custom_id, kwargs in requests:
+            prompt = self._build_prompt(
+                product_name=kwargs['product_name'],
+                product_title=kwargs.get('product_title') or kwargs['product_name'],
+                description=kwargs.get('description'),
+                specs_text=kwargs.get('product_specs_text'),
+                tfidf_terms=kwargs.get('tfidf_terms', []),
+                grouped_terms=kwargs.get('grouped_terms'),
+                missing_types=kwargs.get('missing_types', []),
+                existing_entities=kwargs.get('existing_entities', []),
+                rule_conflicts=kwargs.get('rule_conflicts') or [],
+                search_query=kwargs.get('search_query')
+            )
+            lines.append(json.dumps(self._build_batch_line(custom_id, prompt)))
+
+        batch_file = self._client.files.create(
+            file=("entity_extraction_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self._client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=completion_window
+        )
+        logger.info(f"Submitted entity extraction batch {batch.id} ({len(requests)} requests)")
+        return batch.id
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        custom_ids: List[str]
+    ) -> Optional[Dict[str, LLMExtractionResult]]:
+        """
+        Poll a submitted batch once and collect its results if finished.
+
+        Non-blocking counterpart to extract_batch()'s poll loop: a single
+        batches.retrieve call, so a scheduler can check periodically
+        without tying up a worker for hours.
+
+        Args:
+            batch_id: Id returned by submit_batch()
+            custom_ids: The custom ids that were submitted, so missing
+                output lines still get a failed result rather than a gap
+
+        Returns:
+            None while the batch is still running; otherwise a dict
+            mapping custom_id to LLMExtractionResult (all failed results
+            if the batch ended without completing)
+        """
+        try:
+            batch = self._client.batches.retrieve(batch_id)
+
+            if batch.status not in {"completed", "failed", "expired", "cancelled"}:
+                logger.debug(f"Batch {batch_id} still {batch.status}")
+                return None
+
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Batch {batch_id} ended with status: {batch.status}")
+                return {
+                    custom_id: LLMExtractionResult(
+                        success=False, error=f"Batch ended with status: {batch.status}"
+                    )
+                    for custom_id in custom_ids
+                }
+
+            output_text = self._client.files.content(batch.output_file_id).text
+
+        except Exception as e:
+            logger.error(f"Batch collection failed: {e}", exc_info=True)
+            return {
+                custom_id: LLMExtractionResult(success=False, error=str(e))
+                for custom_id in custom_ids
+            }
+
+        results = self._demux_batch_output(output_text, custom_ids)
+
+        succeeded = sum(1 for r in results.values() if r.success)
+        logger.info(f"Batch {batch_id} complete: {succeeded}/{len(custom_ids)} extractions succeeded")
+
+        return results
+
+    def _demux_batch_output(
+        self,
+        output_text: str,
+        custom_ids: List[str]
+    ) -> Dict[str, LLMExtractionResult]:
+        """
+        Demultiplex a Batch API output file into per-product results.
+
+        Anything missing or unparseable becomes a failed result so callers
+        never see a gap.
+        """
+        results: Dict[str, LLMExtractionResult] = {
+            custom_id: LLMExtractionResult(success=False, error="Missing from batch output")
+            for custom_id in custom_ids
+        }
+
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            custom_id = entry.get("custom_id")
+            if custom_id not in results:
+                continue
+
+            try:
+                if entry.get("error"):
+                    raise ValueError(str(entry["error"]))
+                body = (entry.get("response") or {}).get("body") or {}
+                content = body["choices"][0]["message"]["content"]
+                data = self._coerce_response_data(content)
+                result = self._parse_response(data)
+                result.notes.append(f"LLM extracted {len(result.llm_entities)} entities")
+            except Exception as e:
+                logger.warning(f"Batch result for '{custom_id}' unusable: {e}")
+                result = LLMExtractionResult(success=False, error=str(e))
+
+            results[custom_id] = result
+
+        return results
+
+    def extract_batch(
+        self,
+        requests: List[tuple[str, Dict]],
+        completion_window: str = "24h",
+        poll_interval: float = 30.0
+    ) -> Dict[str, LLMExtractionResult]:
+        """
+        Run many extractions through the OpenAI Batch API in one submission.
+
+        Collapses N realtime HTTP calls into a single uploaded JSONL batch
+        (priced at half the realtime rate). Blocks while polling, so this is
+        for offline/pipeline runs — latency-critical paths should use the
+        per-product extract() instead, and schedulers that cannot block
+        should use submit_batch()/collect_batch() directly.
+
+        Args:
+            requests: List of (custom_id, kwargs) pairs, where kwargs holds
+                the same keyword arguments accepted by extract()
+            completion_window: Batch API completion window
+            poll_interval: Seconds between status polls
+
+        Returns:
+            Dict mapping custom_id to LLMExtractionResult; products the
+            batch could not serve get a failed result rather than a gap
+        """
+        if not requests:
+            return {}
+
+        if not self.is_available():
+            return {
+                custom_id: LLMExtractionResult(success=False, error="LLM not available")
+                for custom_id, _ in requests
+            }
+
+        custom_ids = [custom_id for custom_id, _ in requests]
+
+        try:
+            batch_id = self.submit_batch(requests, completion_window=completion_window)
+        except Exception as e:
+            logger.error(f"Batch submission failed: {e}", exc_info=True)
+            return {
+                custom_id: LLMExtractionResult(success=False, error=str(e))
+                for custom_id in custom_ids
+            }
+
+        results = self.collect_batch(batch_id, custom_ids)
+        while results is None:
+            time.sleep(poll_interval)
+            results = self.collect_batch(batch_id, custom_ids)
+
+        return results
+
+    def extract_marshaled(
+        self,
+        requests: List[tuple[str, Dict]],
+        marshal_size: int = 10
+    ) -> Dict[str, LLMExtractionResult]:
+        """
+        Extract several products per LLM call by marshaling records together.
+
+        Concatenating marshal_size records into one prompt amortizes the
+        fixed system-prompt and network overhead across records — roughly
+        marshal_size times fewer calls than per-product extraction. Chunks
+        whose response cannot be parsed fall back to single-record calls.
+
+        Args:
+            requests: List of (custom_id, kwargs) pairs, where kwargs holds
+                the same keyword arguments accepted by extract()
+            marshal_size: Records per LLM call
+
+        Returns:
+            Dict mapping custom_id to LLMExtractionResult
+        """
+        if not requests:
+            return {}
+
+        if not self.is_available():
+            return {
+                custom_id: LLMExtractionResult(success=False, error="LLM not available")
+                for custom_id, _ in requests
+            }
+
+        results: Dict[str, LLMExtractionResult] = {}
+        for start in range(0, len(requests), marshal_size):
+            chunk = requests[start:start + marshal_size]
+            try:
+                results.update(self._extract_marshaled_chunk(chunk))
+            except Exception as e:
+                logger.warning(
+                    f"Marshaled extraction failed ({e}); falling back to single-record calls"
+                )
+                for custom_id, kwargs in chunk:
+                    results[custom_id] = self.extract(**kwargs)
+
+        return results
+
+    def _extract_marshaled_chunk(
+        self,
+        chunk: List[tuple[str, Dict]]
+    ) -> Dict[str, LLMExtractionResult]:
+        """Run one multi-record extraction call and demultiplex its results."""
+        records = []
+        for custom_id, kwargs in chunk:
+            description = kwargs.get('description') or ''
+            records.append({
+                "product_id": custom_id,
+                "product_name": kwargs['product_name'],
+                "search_query": kwargs.get('search_query') or "",
+                "description": description[:1200],
+                "missing_types": list(kwargs.get('missing_types', [])),
+                "existing_entities": [e.name for e in kwargs.get('existing_entities', [])],
+                "top_terms": [
+                    t.get('phrase') for t in kwargs.get('tfidf_terms', [])[:15]
+                ]
+            })
+
+        prompt = MARSHALED_PROMPT_TEMPLATE.format(
+            record_count=len(records),
+            records_json=json.dumps(records, indent=2)
+        )
+
+        response = self._client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=self.temperature,
+            # Output grows with record count; scale the budget accordingly
+            max_tokens=min(self.max_tokens * len(chunk), 8192)
+        )
+
+        data = json.loads(response.choices[0].message.content)
+        entries = data.get("results")
+        if not isinstance(entries, list):
+            raise ValueError("Marshaled response missing 'results' array")
+
+        by_id = {
+            str(entry.get("product_id")): entry
+            for entry in entries if isinstance(entry, dict)
+        }
+
+        results: Dict[str, LLMExtractionResult] = {}
+        for custom_id, kwargs in chunk:
+            entry = by_id.get(custom_id)
+            if entry is None:
+                logger.warning(f"Marshaled response missing record '{custom_id}'; retrying solo")
+                results[custom_id] = self.extract(**kwargs)
+                continue
+
+            try:
+                coerced = self._coerce_response_data(json.dumps(entry))
+                result = self._parse_response(coerced)
+                result.notes.append(f"LLM extracted {len(result.llm_entities)} entities")
+            except Exception as e:
+                logger.warning(f"Marshaled record '{custom_id}' unusable: {e}")
+                result = LLMExtractionResult(success=False, error=str(e))
+
+            results[custom_id] = result
+
+        return results
+
     def _parse_response(self, data: Dict) -> LLMExtractionResult:
         """Parse LLM response into result object."""
         result = LLMExtractionResult()
@@ -354,9 +354,10 @@ class EntityRulesEngine:
         result = RulesExtractionResult()
         found_types: Set[str] = set()
 
-        # Combine all text for searching
-        all_text = self._build_search_text(product_name, tfidf_terms, description)
+        # Lowercase each phrase exactly once and share the canonical list
+        # between the search text and the per-term extractors.
         term_phrases = [t.get('phrase', '').lower() for t in tfidf_terms if t.get('phrase')]
+        all_text = self._build_search_text(product_name, term_phrases, description)
 
         # Determine product category early using search query for context filtering
         # Search query takes precedence over TF-IDF terms for category detection
@@ -449,16 +450,12 @@ class EntityRulesEngine:
     def _build_search_text(
         self,
         product_name: str,
-        tfidf_terms: List[Dict],
+        term_phrases: List[str],
         description: Optional[str]
     ) -> str:
-        """Build combined text for searching."""
+        """Build combined text for searching from pre-lowercased phrases."""
         parts = [product_name.lower()]
-
-        for term in tfidf_terms:
-            phrase = term.get('phrase', '')
-            if phrase:
-                parts.append(phrase.lower())
+        parts.extend(term_phrases)
 
         if description:
             parts.append(description.lower()[:2000])  # Limit description length
@@ -11,10 +11,9 @@ class TestSerpProcessor(unittest.TestCase):
         sample_path = pathlib.Path("sample_data") / "blue dress.json"
         self.sample_payload = json.loads(sample_path.read_text())
 
-    @patch("src.fluxer.search.serp_processor.GoogleSearch")
-    def test_fetch_products_from_sample_file(self, mock_search_cls):
-        mock_instance = mock_search_cls.return_value
-        mock_instance.get_dict.return_value = self.sample_payload
+    @patch("src.fluxer.search.serp_processor._serp_get")
+    def test_fetch_products_from_sample_file(self, mock_serp_get):
+        mock_serp_get.return_value = self.sample_payload
 
         limit = 3
         result: AggregatedResults = SerpProcessor.fetch_products(
@@ -33,8 +32,7 @@ class TestSerpProcessor(unittest.TestCase):
         )
         self.assertEqual(products[first["title"]], expected_first)
 
-        mock_search_cls.assert_called_once()
-        mock_instance.get_dict.assert_called_once()
+        mock_serp_get.assert_called_once()
 
 
 if __name__ == "__main__":